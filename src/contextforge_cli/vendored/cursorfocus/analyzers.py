@@ -1,18 +1,293 @@
+import atexit
+import hashlib
+import json
 import logging
+import mmap
 import os
 import re
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 from contextforge_cli.vendored.cursorfocus.config import (
+    BINARY_EXTENSION_SUFFIXES,
     BINARY_EXTENSIONS,
     CODE_EXTENSIONS,
     FUNCTION_PATTERNS,
-    IGNORED_KEYWORDS,
+    FUNCTION_PATTERNS_BY_EXTENSION,
+    IGNORED_FILES_PATTERN,
+    IGNORED_KEYWORDS_CI,
     IGNORED_NAMES,
+    NON_CODE_EXTENSION_SUFFIXES,
     NON_CODE_EXTENSIONS,
 )
 
 
+def _compile_function_patterns(
+    patterns: dict[str, str],
+) -> tuple[tuple[str, re.Pattern[str]], ...]:
+    """Compile the function detection patterns once, skipping invalid ones.
+
+    Args:
+        patterns: Mapping of pattern name to regex source.
+
+    Returns:
+        Tuple[Tuple[str, re.Pattern[str]], ...]: ``(name, compiled)`` pairs for
+            every pattern that compiled, in declaration order.
+    """
+    compiled: list[tuple[str, re.Pattern[str]]] = []
+    for pattern_name, pattern in patterns.items():
+        try:
+            compiled.append(
+                (pattern_name, re.compile(pattern, re.MULTILINE | re.DOTALL))
+            )
+        except re.error as e:
+            logging.debug(f"Invalid regex pattern {pattern_name}: {e}")
+    return tuple(compiled)
+
+
+# Every valid function pattern, compiled once at import
+COMPILED_FUNCTION_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    _compile_function_patterns(FUNCTION_PATTERNS)
+)
+
+
+def _build_function_pattern(pattern_names: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine the named function detection patterns into a single alternation.
+
+    Invalid patterns were already dropped by :func:`_compile_function_patterns`.
+    Sub-patterns are wrapped in non-capturing groups, so the only capturing
+    groups left are the function name captures.
+
+    Args:
+        pattern_names: Keys of ``FUNCTION_PATTERNS`` to combine.
+
+    Returns:
+        re.Pattern[str]: Compiled pattern matching any of the valid sub-patterns.
+    """
+    return re.compile(
+        "|".join(
+            f"(?:{compiled.pattern})"
+            for name, compiled in COMPILED_FUNCTION_PATTERNS
+            if name in pattern_names
+        ),
+        re.MULTILINE | re.DOTALL,
+    )
+
+
+def _build_combined_patterns(
+    patterns_by_extension: dict[str, tuple[str, ...]],
+) -> dict[str, re.Pattern[str]]:
+    """Build the combined pattern for each extension.
+
+    Extensions that share the same pattern set (e.g. ``.js``/``.ts``/``.tsx``)
+    share a single compiled pattern object.
+
+    Args:
+        patterns_by_extension: Mapping of extension to pattern names.
+
+    Returns:
+        Dict[str, re.Pattern[str]]: Mapping of extension to combined pattern.
+    """
+    by_names: dict[tuple[str, ...], re.Pattern[str]] = {}
+    combined: dict[str, re.Pattern[str]] = {}
+    for ext, names in patterns_by_extension.items():
+        if names not in by_names:
+            by_names[names] = _build_function_pattern(names)
+        combined[ext] = by_names[names]
+    return combined
+
+
+# One combined pattern per extension so a file is scanned in a single pass
+COMBINED_FUNCTION_PATTERNS: dict[str, re.Pattern[str]] = _build_combined_patterns(
+    FUNCTION_PATTERNS_BY_EXTENSION
+)
+
+# Files above this size are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD: int = 64 * 1024
+
+# Slice size used when counting newlines in a mapped file
+_COUNT_CHUNK: int = 1 << 20
+
+
+# Analysis results keyed by path, valid while (st_mtime_ns, st_size) still match.
+# Persisted in the per-user cache directory, one file per project root
+# registered with load_analysis_cache(), so repeated runs skip unchanged files.
+_ANALYSIS_CACHE_DIR: str = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "contextforge",
+)
+_ANALYSIS_CACHE: dict[str, tuple[int, int, list[tuple[str, str]], int]] = {}
+_ANALYSIS_CACHE_MAX_ENTRIES: int = 50_000
+_analysis_cache_roots: set[str] = set()
+_analysis_cache_dirty: bool = False
+# Guards the cache and its bookkeeping; files are analyzed on thread pools
+_analysis_cache_lock: threading.Lock = threading.Lock()
+
+
+def _analysis_cache_file(project_root: str) -> str:
+    """Return the path of the persisted analysis cache for a project root.
+
+    Args:
+        project_root: Project root directory.
+
+    Returns:
+        str: Cache file named after a hash of the root's absolute path.
+    """
+    digest = hashlib.blake2b(
+        os.fsencode(os.path.abspath(project_root)), digest_size=8
+    ).hexdigest()
+    return os.path.join(_ANALYSIS_CACHE_DIR, f"analysis-{digest}.json")
+
+
+def _read_analysis_cache_file(
+    cache_file: str,
+) -> dict[str, tuple[int, int, list[tuple[str, str]], int]]:
+    """Read a persisted analysis cache.
+
+    Args:
+        cache_file: Path of the cache file.
+
+    Returns:
+        Dict[str, Tuple[int, int, List[Tuple[str, str]], int]]: Entries in file
+            order, or an empty dict if the file is missing or unreadable.
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            path: (mtime_ns, size, [tuple(func) for func in functions], line_count)
+            for path, (mtime_ns, size, functions, line_count) in data.items()
+        }
+    except (OSError, ValueError, TypeError) as e:
+        logging.debug(f"Analysis cache not loaded: {e}")
+        return {}
+
+
+def load_analysis_cache(project_root: str) -> None:
+    """Load a project's persisted analysis cache and save it again on exit.
+
+    Only files under a registered root are persisted; loading the same root
+    again is a no-op.
+
+    Args:
+        project_root: Project root directory, as used to build file paths.
+    """
+    with _analysis_cache_lock:
+        if project_root in _analysis_cache_roots:
+            return
+        # Filled before the root is marked loaded, so no thread sees it half done
+        entries = _read_analysis_cache_file(_analysis_cache_file(project_root))
+        for path, entry in entries.items():
+            _ANALYSIS_CACHE.setdefault(path, entry)
+        _analysis_cache_roots.add(project_root)
+
+
+def _save_analysis_cache() -> None:
+    """Persist the analysis cache of each registered project root.
+
+    Does nothing unless the cache changed during this run. Worker processes
+    save on exit too and the parent never sees their entries, so each file on
+    disk is merged in rather than overwritten, with this process's entries
+    taking precedence. Stale entries are left for :func:`_get_cached_analysis`
+    to reject, and the oldest are dropped beyond
+    ``_ANALYSIS_CACHE_MAX_ENTRIES``. Where ``fcntl`` is available, concurrent
+    savers are serialized on a lock file so none loses another's entries; the
+    result is written under a per-process name and swapped in atomically.
+    """
+    with _analysis_cache_lock:
+        if not _analysis_cache_dirty:
+            return
+        snapshot = list(_ANALYSIS_CACHE.items())
+        roots = list(_analysis_cache_roots)
+    for project_root in roots:
+        prefix = os.path.join(project_root, "")
+        own = {path: entry for path, entry in snapshot if path.startswith(prefix)}
+        if not own:
+            continue
+        cache_file = _analysis_cache_file(project_root)
+        try:
+            os.makedirs(_ANALYSIS_CACHE_DIR, exist_ok=True)
+            with open(f"{cache_file}.lock", "w") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                entries = _read_analysis_cache_file(cache_file)
+                for path, entry in own.items():
+                    # Re-insert so this process's entries count as most recent
+                    entries.pop(path, None)
+                    entries[path] = entry
+                while len(entries) > _ANALYSIS_CACHE_MAX_ENTRIES:
+                    del entries[next(iter(entries))]
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_file, cache_file)
+        except (OSError, TypeError) as e:
+            logging.warning(f"Analysis cache not saved to {cache_file}: {e}")
+
+
+atexit.register(_save_analysis_cache)
+
+
+def _get_cached_analysis(
+    file_path: str, key: tuple[int, int]
+) -> tuple[list[tuple[str, str]], int] | None:
+    """Return the cached analysis of a file if it is still fresh.
+
+    Args:
+        file_path: Path of the analyzed file.
+        key: Current ``(st_mtime_ns, st_size)`` of the file.
+
+    Returns:
+        Optional[Tuple[List[Tuple[str, str]], int]]: A copy of the cached
+            ``(functions, line_count)``, or None if missing or stale.
+    """
+    cached = _ANALYSIS_CACHE.get(file_path)
+    if cached is None or (cached[0], cached[1]) != key:
+        return None
+    return list(cached[2]), cached[3]
+
+
+def _store_analysis(
+    file_path: str,
+    key: tuple[int, int],
+    functions: list[tuple[str, str]],
+    line_count: int,
+) -> None:
+    """Record the analysis of a file under its current stat key.
+
+    Once the cache holds ``_ANALYSIS_CACHE_MAX_ENTRIES`` files, the least
+    recently stored entry is evicted.
+
+    Args:
+        file_path: Path of the analyzed file.
+        key: ``(st_mtime_ns, st_size)`` of the file that was analyzed.
+        functions: Detected ``(function_name, description)`` tuples.
+        line_count: Number of lines in the file.
+    """
+    global _analysis_cache_dirty
+    entry = (key[0], key[1], list(functions), line_count)
+    with _analysis_cache_lock:
+        # Re-insert so dict order stays least recently stored first
+        if _ANALYSIS_CACHE.pop(file_path, None) is None:
+            while len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX_ENTRIES:
+                del _ANALYSIS_CACHE[next(iter(_ANALYSIS_CACHE))]
+        _ANALYSIS_CACHE[file_path] = entry
+        _analysis_cache_dirty = True
+
+
+def _stat_key(file_path: str) -> tuple[int, int]:
+    """Return the ``(st_mtime_ns, st_size)`` freshness key of a file."""
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size
+
+
 def is_binary_file(filename: str) -> bool:
     """Check if a file is binary or non-code based on its extension.
 
@@ -22,26 +297,146 @@ def is_binary_file(filename: str) -> bool:
     Returns:
         bool: True if the file is binary or non-code, False otherwise.
     """
-    ext = os.path.splitext(filename)[1].lower()
+    name = filename.lower()
+
+    # Binary extensions, then documentation and text files that shouldn't be
+    # analyzed for functions
+    return name.endswith(BINARY_EXTENSION_SUFFIXES) or name.endswith(
+        NON_CODE_EXTENSION_SUFFIXES
+    )
 
-    # Binary extensions
-    if ext in BINARY_EXTENSIONS:
-        return True
 
-    # Documentation and text files that shouldn't be analyzed for functions
-    return ext in NON_CODE_EXTENSIONS
+# Bound once; the ignored_files globs are compiled into a single pattern
+_match_ignored_file = IGNORED_FILES_PATTERN.match
 
 
 def should_ignore_file(name: str) -> bool:
     """Check if a file or directory should be ignored during analysis.
 
+    A name is ignored if it is hidden, listed in ``ignored_directories`` or
+    matches one of the ``ignored_files`` glob patterns.
+
     Args:
         name: The name of the file or directory to check.
 
     Returns:
         bool: True if the file/directory should be ignored, False otherwise.
     """
-    return name in IGNORED_NAMES or name.startswith(".")
+    return (
+        name in IGNORED_NAMES
+        or name.startswith(".")
+        or _match_ignored_file(name) is not None
+    )
+
+
+def should_ignore_entry(entry: os.DirEntry[str]) -> bool:
+    """Check if a directory entry should be ignored during analysis.
+
+    Same rules as :func:`should_ignore_file`, applied to the entry name that
+    ``os.scandir`` already produced, so no extra path handling or stat is needed.
+
+    Args:
+        entry: The directory entry to check.
+
+    Returns:
+        bool: True if the entry should be ignored, False otherwise.
+    """
+    name = entry.name
+    return (
+        name in IGNORED_NAMES
+        or name.startswith(".")
+        or _match_ignored_file(name) is not None
+    )
+
+
+def walk_code_files(root: str) -> Iterator[tuple[os.DirEntry[str], str]]:
+    """Walk a directory tree and yield the code files worth analyzing.
+
+    Uses ``os.scandir`` so file/directory type comes from the directory listing
+    itself, and skips ignored directories before descending into them.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Tuple[os.DirEntry[str], str]: The file entry and its lowercased extension,
+            for every non-ignored file whose extension is in ``CODE_EXTENSIONS``.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if should_ignore_entry(entry):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in CODE_EXTENSIONS and entry.is_file():
+                        yield entry, ext
+        except OSError as e:
+            logging.debug(f"Error scanning directory {current}: {e}")
+
+
+def count_lines(data: bytes | mmap.mmap) -> int:
+    """Count lines on raw bytes; no decode or per-line list needed.
+
+    Args:
+        data: File contents.
+
+    Returns:
+        int: Number of lines, counting a final line without a trailing newline.
+    """
+    # mmap has no count() before 3.13, so count it in bounded slices
+    line_count = sum(
+        data[start : start + _COUNT_CHUNK].count(b"\n")
+        for start in range(0, len(data), _COUNT_CHUNK)
+    )
+    if len(data) and data[-1:] != b"\n":
+        line_count += 1
+    return line_count
+
+
+def _find_functions(
+    pattern: re.Pattern[str] | None, content: str
+) -> list[tuple[str, str]]:
+    """Collect function names matched by a combined pattern.
+
+    Args:
+        pattern: Combined pattern for the file's extension. None if the
+            extension has no patterns.
+        content: Decoded file text.
+
+    Returns:
+        List[Tuple[str, str]]: ``(function_name, description)`` tuples, one per
+            distinct name in order of first appearance.
+    """
+    functions: list[tuple[str, str]] = []
+    if pattern is None:
+        return functions
+
+    # One sweep over the content with the extension's combined pattern;
+    # lookups are bound to locals for the per-match loop
+    ignored = IGNORED_KEYWORDS_CI
+    # Overlapping patterns (e.g. js_function / js_class_method) and repeated
+    # definitions hit the same name; keep only the first occurrence
+    seen: set[str] = set()
+    mark_seen = seen.add
+    append = functions.append
+    for match in pattern.finditer(content):
+        # The name captures are the only capturing groups and exactly one
+        # of them takes part in a match, so lastindex points straight at it
+        group_index = match.lastindex
+        if not group_index:
+            continue
+        func_name = match.group(group_index)
+        if not func_name or func_name in ignored or func_name in seen:
+            continue
+        mark_seen(func_name)
+        append((func_name, "Function detected"))
+    return functions
 
 
 def analyze_file_content_and_desc(file_path: str) -> tuple[list[tuple[str, str]], int]:
@@ -63,42 +458,110 @@ def analyze_file_content_and_desc(file_path: str) -> tuple[list[tuple[str, str]]
     Note:
         Returns empty list and 0 lines if file is binary, non-code, or encounters an error.
     """
-    try:
-        # Skip binary and non-code files
-        if is_binary_file(file_path):
-            return [], 0
+    result = _analyze_file(file_path)
+    return result if result is not None else ([], 0)
+
 
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+def _analyze_file(file_path: str) -> tuple[list[tuple[str, str]], int] | None:
+    """Analyze a file like :func:`analyze_file_content_and_desc`, flagging errors.
 
-        # Skip files that don't look like actual code files
+    Args:
+        file_path: Path to the file to analyze.
+
+    Returns:
+        Optional[Tuple[List[Tuple[str, str]], int]]: ``(functions, line_count)``,
+            or None if the file could not be read or decoded, so callers can
+            tell a failure from an empty file and avoid caching it.
+    """
+    try:
+        # Skip binary, non-code and unknown files before touching the disk
         ext = os.path.splitext(file_path)[1].lower()
-        if ext not in CODE_EXTENSIONS:
+        if (
+            ext in BINARY_EXTENSIONS
+            or ext in NON_CODE_EXTENSIONS
+            or ext not in CODE_EXTENSIONS
+        ):
             return [], 0
 
-        functions: list[tuple[str, str]] = []
+        # Unchanged files are served from the cache without being read
+        key = _stat_key(file_path)
+        cached = _get_cached_analysis(file_path, key)
+        if cached is not None:
+            return cached
 
-        # Use patterns for function detection
-        for pattern_name, pattern in FUNCTION_PATTERNS.items():
-            try:
-                matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
-                for match in matches:
-                    func_name = next(filter(None, match.groups()), None)
-                    if not func_name or func_name.lower() in IGNORED_KEYWORDS:
-                        continue
-                    functions.append((func_name, "Function detected"))
-            except re.error as e:
-                logging.debug(
-                    f"Invalid regex pattern {pattern_name} for {file_path}: {e}"
-                )
-                continue
-            except Exception as e:
-                logging.debug(
-                    f"Error analyzing pattern {pattern_name} for {file_path}: {e}"
-                )
-                continue
+        if key[1] > MMAP_THRESHOLD:
+            # Count lines on the page cache directly and decode straight from
+            # it, skipping the intermediate bytes copy
+            with (
+                open(file_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                line_count = count_lines(mm)
+                content = str(mm, "utf-8")
+        else:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            line_count = count_lines(data)
+            content = data.decode("utf-8")
+        functions = _find_functions(COMBINED_FUNCTION_PATTERNS.get(ext), content)
 
-        return functions, len(content.split("\n"))
+        _store_analysis(file_path, key, functions, line_count)
+        return functions, line_count
     except Exception as e:
         print(f"Error analyzing file {file_path}: {e}")
-        return [], 0
+        return None
+
+
+def analyze_files(
+    file_paths: Iterable[str],
+    max_workers: int | None = None,
+    chunksize: int = 64,
+) -> list[tuple[list[tuple[str, str]], int]]:
+    """Analyze many files in parallel across worker processes.
+
+    Regex matching is CPU-bound, so files are distributed over a process pool
+    using :func:`analyze_file_content_and_desc` unchanged for each file. Files
+    that are still fresh in this process's analysis cache are not dispatched, and
+    worker results are recorded in it; files that failed to analyze are not.
+
+    Args:
+        file_paths: Paths of the files to analyze.
+        max_workers: Number of worker processes (default: ``os.cpu_count()``).
+        chunksize: Number of paths handed to a worker at a time (default: 64).
+
+    Returns:
+        List[Tuple[List[Tuple[str, str]], int]]: One ``(functions, line_count)``
+            result per input path, in the same order as ``file_paths``.
+    """
+    paths = list(file_paths)
+    results: list[tuple[list[tuple[str, str]], int] | None] = []
+    misses: list[tuple[int, str, tuple[int, int]]] = []
+    for index, path in enumerate(paths):
+        try:
+            key = _stat_key(path)
+        except OSError:
+            results.append(([], 0))
+            continue
+        cached = _get_cached_analysis(path, key)
+        results.append(cached)
+        if cached is None:
+            misses.append((index, path, key))
+
+    if len(misses) < 2:
+        for index, path, _key in misses:
+            results[index] = analyze_file_content_and_desc(path)
+        return results  # type: ignore[return-value]
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        analyzed = executor.map(
+            _analyze_file,
+            [path for _index, path, _key in misses],
+            chunksize=chunksize,
+        )
+        for (index, path, key), result in zip(misses, analyzed, strict=True):
+            if result is None:
+                results[index] = ([], 0)
+                continue
+            _store_analysis(path, key, *result)
+            results[index] = result
+    return results  # type: ignore[return-value]
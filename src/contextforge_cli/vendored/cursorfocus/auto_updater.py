@@ -3,6 +3,7 @@ import logging
 import os
 import shutil
 import tempfile
+import time
 import zipfile
 from datetime import UTC, datetime, timezone
 from typing import Any, Dict, NoReturn, Optional
@@ -27,6 +28,23 @@ def clear_console() -> None:
         os.system("clear")
 
 
+def _install_file(src: str, dst: str) -> None:
+    """Move a file into place, copying only when a rename is not possible.
+
+    The extracted update lives in a temporary directory that is normally on the
+    same filesystem, so ``os.replace`` is a metadata-only atomic rename. Across
+    filesystems it raises ``OSError`` and the file is copied instead.
+
+    Args:
+        src: Path of the extracted file.
+        dst: Destination path in the installation directory.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 class AutoUpdater:
     """A class to handle automatic updates from a GitHub repository.
 
@@ -49,13 +67,23 @@ class AutoUpdater:
         """
         self.repo_url: str = repo_url
         self.api_url: str = repo_url.replace("github.com", "api.github.com/repos")
-
-    def check_for_updates(self) -> dict[str, Any] | None:
+        # Reuse one connection pool so repeated checks skip the TLS handshake
+        self._session: requests.Session = requests.Session()
+        self._session.headers["Accept"] = "application/vnd.github.v3+json"
+        self._cache_file: str = os.path.join(
+            os.path.dirname(__file__), ".update_cache.json"
+        )
+
+    def check_for_updates(self, max_age: float = 0) -> dict[str, Any] | None:
         """Check for available updates from the GitHub repository.
 
         This method compares the current commit SHA with the latest commit in the repository.
         If an update is available, it returns information about the new version.
 
+        Args:
+            max_age: Seconds for which the commit saved by the previous check is
+                trusted without contacting GitHub. Defaults to 0 (always check).
+
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing update information if available:
                 - sha: The commit SHA
@@ -66,18 +94,21 @@ class AutoUpdater:
                 Returns None if no update is available or if an error occurs.
 
         Note:
-            The method attempts to check both 'main' and 'master' branches if necessary.
+            The method checks the 'master' branch when 'main' does not exist.
+            Requests are conditional on the ETag of the branch's previous
+            response, so an unchanged branch costs a bodiless 304 that GitHub
+            does not rate-limit. Within ``max_age`` of the last check no request
+            is made at all.
         """
         try:
             # Check commit latest
-            response = requests.get(f"{self.api_url}/commits/main")
-            if response.status_code == 404:
-                response = requests.get(f"{self.api_url}/commits/master")
+            latest_commit = self._fresh_cached_commit(max_age)
+            if latest_commit is None:
+                latest_commit = self._fetch_default_branch_commit()
 
-            if response.status_code != 200:
+            if latest_commit is None:
                 return None
 
-            latest_commit = response.json()
             current_commit = self._get_current_commit()
 
             if latest_commit["sha"] != current_commit:
@@ -102,6 +133,120 @@ class AutoUpdater:
             logging.error(f"Error checking for updates: {e}")
             return None
 
+    def _fetch_default_branch_commit(self) -> dict[str, Any] | None:
+        """Fetch the latest commit of 'main', or of 'master' if 'main' is missing.
+
+        The branch that answered the previous check is asked first, so
+        repositories without 'main' do not pay for a 404 on every check. The
+        other branch is only tried on a 404; rate limiting and server errors
+        are not retried.
+
+        Returns:
+            Optional[Dict[str, Any]]: The commit JSON, None if unavailable.
+        """
+        cache = self._load_update_cache()
+        first = cache.get("branch", "main")
+        status, latest_commit = self._fetch_latest_commit(first, cache)
+        if status == 404:
+            other = "master" if first == "main" else "main"
+            status, latest_commit = self._fetch_latest_commit(other, cache)
+        return latest_commit
+
+    def _fetch_latest_commit(
+        self, branch: str, cache: dict[str, Any]
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Fetch the latest commit of a branch, revalidating against the cache.
+
+        Redirects are not followed, so a moved repository is reported as
+        unavailable instead of silently checking another one.
+
+        Args:
+            branch: Name of the branch to query.
+            cache: Update cache loaded by :meth:`_load_update_cache`; updated
+                and saved when a new commit is fetched.
+
+        Returns:
+            Tuple[int, Optional[Dict[str, Any]]]: The HTTP status and the commit
+                JSON from the API (or the cached copy when GitHub answers 304
+                Not Modified), None if unavailable.
+        """
+        url = f"{self.api_url}/commits/{branch}"
+        cached = cache.get("branches", {}).get(branch, {})
+
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        response = self._session.get(url, headers=headers, allow_redirects=False)
+        if response.status_code == 304 and cached.get("commit"):
+            # Restart the freshness window without rewriting the cache
+            try:
+                os.utime(self._cache_file)
+            except OSError:
+                pass
+            return 304, cached["commit"]
+        if response.status_code != 200:
+            return response.status_code, None
+
+        latest_commit = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            cache.setdefault("branches", {})[branch] = {
+                "etag": etag,
+                "commit": latest_commit,
+            }
+            cache["branch"] = branch
+            cache["commit"] = latest_commit
+            self._save_update_cache(cache)
+        return 200, latest_commit
+
+    def _fresh_cached_commit(self, max_age: float) -> dict[str, Any] | None:
+        """Return the commit saved by the last check if it is recent enough.
+
+        Freshness is judged by the cache file's modification time, so only a
+        stat is needed when the cache is stale.
+
+        Args:
+            max_age: Maximum age of the cache in seconds.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached commit JSON, or None if the cache
+                is missing or older than ``max_age``.
+        """
+        if max_age <= 0:
+            return None
+        try:
+            if time.time() - os.stat(self._cache_file).st_mtime >= max_age:
+                return None
+        except OSError:
+            return None
+        return self._load_update_cache().get("commit")
+
+    def _load_update_cache(self) -> dict[str, Any]:
+        """Load the ETag and commit payload saved by the previous check.
+
+        Returns:
+            Dict[str, Any]: The cached data, or an empty dict if unavailable.
+        """
+        try:
+            with open(self._cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_update_cache(self, data: dict[str, Any]) -> None:
+        """Persist the ETag and commit payload for the next conditional request.
+
+        Args:
+            data: Dictionary with the ETag and commit JSON per branch, the
+                branch that answered last and its commit JSON.
+        """
+        try:
+            with open(self._cache_file, "w") as f:
+                json.dump(data, f)
+        except OSError as e:
+            logging.debug(f"Could not save update cache: {e}")
+
     def _get_current_commit(self) -> str:
         """Get the SHA of the current commit from the local file.
 
@@ -143,16 +288,19 @@ class AutoUpdater:
             The function will log any errors that occur during the update process.
         """
         try:
-            # Download zip file of branch
-            response = requests.get(update_info["download_url"])
-            if response.status_code != 200:
-                return False
-
-            # Save zip file temporarily
+            # Stream zip file of branch straight to disk in 1 MiB chunks so the
+            # archive is never held in memory as a whole
             temp_dir = tempfile.mkdtemp()
             zip_path = os.path.join(temp_dir, "update.zip")
-            with open(zip_path, "wb") as f:
-                f.write(response.content)
+            download_url = update_info["download_url"]
+            with self._session.get(download_url, stream=True) as response:
+                if response.status_code != 200:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    return False
+
+                with open(zip_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
 
             # Unzip and update
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
@@ -164,13 +312,15 @@ class AutoUpdater:
                 src_dir = os.path.join(temp_dir, root_dir)
                 dst_dir = os.path.dirname(__file__)
 
-                for item in os.listdir(src_dir):
-                    s = os.path.join(src_dir, item)
-                    d = os.path.join(dst_dir, item)
-                    if os.path.isfile(s):
-                        shutil.copy2(s, d)
-                    elif os.path.isdir(s):
-                        shutil.copytree(s, d, dirs_exist_ok=True)
+                for dirpath, _dirnames, filenames in os.walk(src_dir):
+                    rel_dir = os.path.relpath(dirpath, src_dir)
+                    target_dir = os.path.normpath(os.path.join(dst_dir, rel_dir))
+                    os.makedirs(target_dir, exist_ok=True)
+                    for filename in filenames:
+                        _install_file(
+                            os.path.join(dirpath, filename),
+                            os.path.join(target_dir, filename),
+                        )
 
             # Save SHA of new commit
             with open(os.path.join(dst_dir, ".current_commit"), "w") as f:
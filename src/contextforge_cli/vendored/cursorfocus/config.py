@@ -1,7 +1,17 @@
+import fnmatch
 import json
 import os
+import re
+from collections.abc import Callable
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 
 def load_config() -> dict[str, Any] | None:
     """Load configuration settings from config.json file.
@@ -22,9 +32,9 @@ def load_config() -> dict[str, Any] | None:
         config_path = os.path.join(script_dir, "config.json")
 
         if os.path.exists(config_path):
-            with open(config_path) as f:
+            with open(config_path, "rb") as f:
                 if config_path.endswith(".json"):
-                    return json.load(f)
+                    return _json_loads(f.read())
 
         return get_default_config()
     except Exception as e:
@@ -101,43 +111,51 @@ def get_default_config() -> dict[str, Any]:
 _config: dict[str, Any] | None = load_config()
 
 # Binary file extensions that should be ignored
-BINARY_EXTENSIONS: set[str] = set(_config.get("binary_extensions", []))
+BINARY_EXTENSIONS: frozenset[str] = frozenset(_config.get("binary_extensions", []))
 
 # Documentation and text files that shouldn't be analyzed for functions
-NON_CODE_EXTENSIONS: set[str] = {
-    ".md",
-    ".txt",
-    ".log",
-    ".json",
-    ".yml",
-    ".toml",
-    ".ini",
-    ".cfg",
-    ".conf",
-    ".config",
-    ".markdown",
-    ".rst",
-    ".rdoc",
-    ".csv",
-    ".tsv",
-}
+NON_CODE_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        ".md",
+        ".txt",
+        ".log",
+        ".json",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".conf",
+        ".config",
+        ".markdown",
+        ".rst",
+        ".rdoc",
+        ".csv",
+        ".tsv",
+    }
+)
 
 # Extensions that should be analyzed for code
-CODE_EXTENSIONS: set[str] = {
-    ".py",  # Python
-    ".js",  # JavaScript
-    ".ts",  # TypeScript
-    ".tsx",  # TypeScript/React
-    ".kt",  # Kotlin
-    ".php",  # PHP
-    ".swift",  # Swift
-    ".cpp",  # C++
-    ".c",  # C
-    ".h",  # C/C++ Header
-    ".hpp",  # C++ Header
-    ".cs",  # C#
-    ".csx",  # C# Script
-}
+CODE_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        ".py",  # Python
+        ".js",  # JavaScript
+        ".ts",  # TypeScript
+        ".tsx",  # TypeScript/React
+        ".kt",  # Kotlin
+        ".php",  # PHP
+        ".swift",  # Swift
+        ".cpp",  # C++
+        ".c",  # C
+        ".h",  # C/C++ Header
+        ".hpp",  # C++ Header
+        ".cs",  # C#
+        ".csx",  # C# Script
+    }
+)
+
+# Suffix tuples so extension checks can use a single C-level str.endswith
+BINARY_EXTENSION_SUFFIXES: tuple[str, ...] = tuple(BINARY_EXTENSIONS)
+NON_CODE_EXTENSION_SUFFIXES: tuple[str, ...] = tuple(NON_CODE_EXTENSIONS)
 
 # Regex patterns for function detection
 FUNCTION_PATTERNS: dict[str, str] = {
@@ -152,58 +170,109 @@ FUNCTION_PATTERNS: dict[str, str] = {
     # PHP
     "php_function": r"(?:public\s+|private\s+|protected\s+)?function\s+([a-zA-Z_]\w*)\s*\(",
     # C/C++
-    "cpp_function": r"(?:virtual\s+)?(?:static\s+)?(?:inline\s+)?(?:const\s+)?(?:\w+(?:::\w+)*\s+)?([a-zA-Z_]\w*)\s*\([^)]*\)(?:\s*const)?(?:\s*noexcept)?(?:\s*override)?(?:\s*final)?(?:\s*=\s*0)?(?:\s*=\s*default)?(?:\s*=\s*delete)?(?:{|;)",
+    # Possessive quantifiers (Python 3.11+) keep a failing declaration from
+    # backtracking through every combination of the optional qualifiers
+    "cpp_function": r"(?:virtual\s++)?+(?:static\s++)?+(?:inline\s++)?+(?:const\s++)?+(?:\w++(?:::\w++)*+\s++)?([a-zA-Z_]\w*+)\s*+\([^)]*+\)(?:\s*+const)?+(?:\s*+noexcept)?+(?:\s*+override)?+(?:\s*+final)?+(?:\s*+=\s*+0)?+(?:\s*+=\s*+default)?+(?:\s*+=\s*+delete)?+\s*+(?:{|;)",
     # C#
-    "csharp_method": r"(?:public|private|protected|internal|static|virtual|override|abstract|sealed|async)\s+(?:\w+(?:<[^>]+>)?)\s+([a-zA-Z_]\w*)\s*\([^)]*\)",
+    "csharp_method": r"(?:public|private|protected|internal|static|virtual|override|abstract|sealed|async)\s++(?:\w++(?:<[^>]++>)?+)\s++([a-zA-Z_]\w*+)\s*+\([^)]*+\)",
     # Kotlin
     "kotlin_function": r"(?:fun\s+)?([a-zA-Z_]\w*)\s*(?:<[^>]+>)?\s*\([^)]*\)(?:\s*:\s*[^{]+)?\s*{",
     # Swift
     "swift_function": r"(?:func\s+)([a-zA-Z_]\w*)\s*(?:<[^>]+>)?\s*\([^)]*\)(?:\s*->\s*[^{]+)?\s*{",
 }
 
-# Keywords that should not be treated as function names
-IGNORED_KEYWORDS: set[str] = {
-    "if",
-    "switch",
-    "while",
-    "for",
-    "catch",
-    "finally",
-    "else",
-    "return",
-    "break",
-    "continue",
-    "case",
-    "default",
-    "to",
-    "from",
-    "import",
-    "as",
-    "try",
-    "except",
-    "raise",
-    "with",
-    "async",
-    "await",
-    "yield",
-    "assert",
-    "pass",
-    "del",
-    "print",
-    "in",
-    "is",
-    "not",
-    "and",
-    "or",
-    "lambda",
-    "global",
-    "nonlocal",
-    "class",
-    "def",
+# Function patterns that apply to each code extension
+_JS_FUNCTION_PATTERNS: tuple[str, ...] = (
+    "js_function",
+    "js_arrow",
+    "js_method",
+    "js_class_method",
+)
+_CPP_FUNCTION_PATTERNS: tuple[str, ...] = ("cpp_function",)
+_CSHARP_FUNCTION_PATTERNS: tuple[str, ...] = ("csharp_method",)
+
+FUNCTION_PATTERNS_BY_EXTENSION: dict[str, tuple[str, ...]] = {
+    ".py": ("python_function", "python_class"),
+    ".js": _JS_FUNCTION_PATTERNS,
+    ".ts": _JS_FUNCTION_PATTERNS,
+    ".tsx": _JS_FUNCTION_PATTERNS,
+    ".kt": ("kotlin_function",),
+    ".php": ("php_function",),
+    ".swift": ("swift_function",),
+    ".cpp": _CPP_FUNCTION_PATTERNS,
+    ".c": _CPP_FUNCTION_PATTERNS,
+    ".h": _CPP_FUNCTION_PATTERNS,
+    ".hpp": _CPP_FUNCTION_PATTERNS,
+    ".cs": _CSHARP_FUNCTION_PATTERNS,
+    ".csx": _CSHARP_FUNCTION_PATTERNS,
 }
 
+# Keywords that should not be treated as function names
+IGNORED_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "if",
+        "switch",
+        "while",
+        "for",
+        "catch",
+        "finally",
+        "else",
+        "return",
+        "break",
+        "continue",
+        "case",
+        "default",
+        "to",
+        "from",
+        "import",
+        "as",
+        "try",
+        "except",
+        "raise",
+        "with",
+        "async",
+        "await",
+        "yield",
+        "assert",
+        "pass",
+        "del",
+        "print",
+        "in",
+        "is",
+        "not",
+        "and",
+        "or",
+        "lambda",
+        "global",
+        "nonlocal",
+        "class",
+        "def",
+    }
+)
+
+# Keywords in the spellings they are written in (lower, UPPER, Capitalized), so
+# a matched name is tested with one hash lookup and no lowercased copy
+IGNORED_KEYWORDS_CI: frozenset[str] = frozenset(
+    variant
+    for keyword in IGNORED_KEYWORDS
+    for variant in (keyword, keyword.upper(), keyword.capitalize())
+)
+
 # Names of files and directories that should be ignored
-IGNORED_NAMES: set[str] = set(_config.get("ignored_directories", []))
+IGNORED_NAMES: frozenset[str] = frozenset(_config.get("ignored_directories", []))
+
+# Glob patterns from ignored_files (e.g. "*.pyc") translated and joined into a
+# single regex once, so testing a name is one match call; never matches if empty
+IGNORED_FILES_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in _config.get("ignored_files", []))
+    or r"(?!)"
+)
+
+# Directories that are never worth descending into, even when a custom
+# config.json leaves them out of ignored_directories
+PRUNED_DIRECTORIES: frozenset[str] = frozenset(
+    {".git", "node_modules", "__pycache__", ".venv", "dist", "build"}
+)
 
 FILE_LENGTH_STANDARDS: dict[str, int] = _config.get("file_length_standards", {})
 
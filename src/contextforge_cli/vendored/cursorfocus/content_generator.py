@@ -1,28 +1,45 @@
-import logging
+import io
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from contextforge_cli.vendored.cursorfocus.analyzers import (
     analyze_file_content_and_desc,
     is_binary_file,
+    load_analysis_cache,
     should_ignore_file,
 )
 from contextforge_cli.vendored.cursorfocus.config import (
     CODE_EXTENSIONS,
-    FUNCTION_PATTERNS,
-    IGNORED_KEYWORDS,
     NON_CODE_EXTENSIONS,
+    PRUNED_DIRECTORIES,
     get_file_length_limit,
     load_config,
 )
 from contextforge_cli.vendored.cursorfocus.project_detector import (
-    detect_project_type,
     get_file_type_info,
     get_project_description,
 )
 
+# Common built-ins and helper names left out of the "Key Files" listing
+_BUILTIN_BLACKLIST: frozenset[str] = frozenset(
+    {
+        "set",
+        "get",
+        "items",
+        "exists",
+        "enumerate",
+        "input",
+        "int",
+        "next",
+        "detection",
+        "names",
+        "walk",
+        "endswith",
+    }
+)
+
 
 class ProjectMetrics:
     """Class to track and store project-wide metrics during analysis.
@@ -51,6 +68,107 @@ class ProjectMetrics:
         self.files_with_functions: list[tuple[str, list[tuple[str, str]], int]] = []
 
 
+def _is_pruned(name: str) -> bool:
+    """Check if a directory entry is left out of the structure.
+
+    Heavy directories are caught with one set lookup before the configurable
+    ignore rules.
+
+    Args:
+        name: File or directory name
+
+    Returns:
+        bool: True if the entry should be skipped
+    """
+    return name in PRUNED_DIRECTORIES or should_ignore_file(name)
+
+
+def _scan_directory(
+    project_path: str,
+    max_depth: int,
+    current_depth: int,
+    pending: list[tuple[dict[str, Any], str, str, str]],
+) -> dict[str, Any]:
+    """Build the directory skeleton and queue the code files for analysis.
+
+    Lists each directory once with ``os.scandir`` and descends into a
+    subdirectory, symlinked ones included, as soon as the listing reaches it,
+    so structure and ``pending`` keep the order of a recursive depth-first
+    listing. Ignored directories are never listed, and a symlink back to a
+    directory being scanned is skipped. Each code file gets a
+    ``{"type": "file"}`` placeholder in the structure, filled in by
+    :func:`get_directory_structure` once the file is analyzed.
+
+    Args:
+        project_path: Directory to scan
+        max_depth: Maximum depth to traverse in the directory tree
+        current_depth: Depth of ``project_path`` in the traversal
+        pending: Receives ``(file_info, name, path, ext)`` for every code file,
+            in traversal order
+
+    Returns:
+        Dict[str, Any]: The directory structure with file placeholders.
+    """
+    if current_depth > max_depth:
+        return {}
+
+    # Canonical paths of the directories being scanned, to break symlink loops
+    ancestors: set[str] = {os.path.realpath(project_path)}
+
+    def scan(path: str, real_path: str, depth: int) -> dict[str, Any]:
+        structure: dict[str, Any] = {}
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"Error scanning directory {path}: {e}")
+            return structure
+
+        for entry in entries:
+            name = entry.name
+            if _is_pruned(name):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # Deeper directories would come back empty, so don't list them
+                if depth >= max_depth:
+                    continue
+                if entry.is_symlink():
+                    child_real = os.path.realpath(entry.path)
+                    if child_real in ancestors:
+                        continue
+                else:
+                    child_real = os.path.join(real_path, name)
+                ancestors.add(child_real)
+                child = scan(entry.path, child_real, depth + 1)
+                ancestors.discard(child_real)
+                if child:
+                    structure[name] = child
+                continue
+
+            # Dotfiles were skipped above, so slicing from the last dot
+            # gives the same extension as os.path.splitext
+            dot = name.rfind(".")
+            if dot <= 0:
+                continue
+            ext = name[dot:].lower()
+            if ext not in CODE_EXTENSIONS:
+                continue
+            if is_binary_file(name):
+                continue
+
+            file_info: dict[str, Any] = {"type": "file"}
+            structure[name] = file_info
+            pending.append((file_info, name, entry.path, ext))
+        return structure
+
+    return scan(project_path, next(iter(ancestors)), current_depth)
+
+
 def get_directory_structure(
     project_path: str,
     max_depth: int = 3,
@@ -59,8 +177,9 @@ def get_directory_structure(
 ) -> dict[str, Any]:
     """Get the directory structure with detailed file information.
 
-    Recursively traverses the project directory to build a tree structure of files and directories,
-    collecting metrics and analyzing files for functions along the way.
+    Traverses the project directory to build a tree structure of files and directories,
+    then analyzes the collected files for functions on a thread pool so their reads
+    overlap, collecting metrics along the way.
 
     Args:
         project_path: Path to the project root directory
@@ -82,62 +201,76 @@ def get_directory_structure(
     Note:
         Skips binary files, ignored files/directories, and respects max_depth limit.
     """
-    if current_depth > max_depth:
-        return {}
-
-    structure: dict[str, Any] = {}
-    try:
-        for item in os.listdir(project_path):
-            if should_ignore_file(item):
-                continue
+    pending: list[tuple[dict[str, Any], str, str, str]] = []
+    structure = _scan_directory(project_path, max_depth, current_depth, pending)
+    if not pending:
+        return structure
+
+    # Unchanged files are served from the analysis cache saved by earlier runs
+    load_analysis_cache(project_path)
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            analyze_file_content_and_desc, [item_path for _, _, item_path, _ in pending]
+        )
+
+        # Results come back in submission order, so metrics are folded in
+        # traversal order on this thread without any locking
+        for (file_info, item, item_path, ext), (functions, line_count) in zip(
+            pending, results, strict=True
+        ):
+            if metrics:
+                metrics.total_files += 1
+                metrics.files_by_type[ext] = metrics.files_by_type.get(ext, 0) + 1
+                metrics.lines_by_type[ext] = (
+                    metrics.lines_by_type.get(ext, 0) + line_count
+                )
+                metrics.total_lines += line_count
+
+                if functions:
+                    # Remove duplicates and sort functions; the analyzer
+                    # already returns distinct names, so this is usually a copy
+                    if len(functions) > 1:
+                        seen: set[str] = set()
+                        unique_functions = []
+                        for func in functions:
+                            if func[0] not in seen:
+                                seen.add(func[0])
+                                unique_functions.append(func)
+                    else:
+                        unique_functions = list(functions)
+                    unique_functions.sort(key=lambda x: x[0].lower())
+                    metrics.files_with_functions.append(
+                        (item_path, unique_functions, line_count)
+                    )
 
-            item_path = os.path.join(project_path, item)
+            file_type, file_desc = get_file_type_info(item)
+            file_info["line_count"] = line_count
+            file_info["description"] = file_desc
+            file_info["functions"] = functions
 
-            if os.path.isdir(item_path):
-                substructure = get_directory_structure(
-                    item_path, max_depth, current_depth + 1, metrics
-                )
-                if substructure:
-                    structure[item] = substructure
-            else:
-                if is_binary_file(item_path):
-                    continue
+    return structure
 
-                ext = os.path.splitext(item)[1].lower()
-                if ext not in CODE_EXTENSIONS:
-                    continue
 
-                functions, line_count = analyze_file_content_and_desc(item_path)
+def _sorted_tree_items(structure: dict[str, Any]) -> list[tuple[str, Any]]:
+    """Return one directory level's entries in tree display order.
 
-                if metrics:
-                    metrics.total_files += 1
-                    metrics.files_by_type[ext] = metrics.files_by_type.get(ext, 0) + 1
-                    metrics.lines_by_type[ext] = (
-                        metrics.lines_by_type.get(ext, 0) + line_count
-                    )
-                    metrics.total_lines += line_count
-
-                    if functions:
-                        # Remove duplicates and sort functions
-                        unique_functions = list(
-                            {func[0]: func for func in functions}.values()
-                        )
-                        unique_functions.sort(key=lambda x: x[0].lower())
-                        metrics.files_with_functions.append(
-                            (item_path, unique_functions, line_count)
-                        )
-
-                file_type, file_desc = get_file_type_info(item)
-                structure[item] = {
-                    "type": "file",
-                    "line_count": line_count,
-                    "description": file_desc,
-                    "functions": functions,
-                }
-    except Exception as e:
-        print(f"Error scanning directory {project_path}: {e}")
+    Args:
+        structure: One level of the directory structure.
 
-    return structure
+    Returns:
+        List[Tuple[str, Any]]: ``(name, info)`` pairs, files before directories,
+            each group sorted by name.
+    """
+    # Decorate once per entry and sort plain tuples; names are unique within a
+    # level, so the info values are never compared
+    decorated = [
+        (isinstance(info, dict) and info.get("type") != "file", name, info)
+        for name, info in structure.items()
+    ]
+    decorated.sort()
+    return [(name, info) for _, name, info in decorated]
 
 
 def structure_to_tree(
@@ -164,34 +297,84 @@ def structure_to_tree(
     Note:
         Files are sorted to appear after directories in the tree.
     """
+
     lines: list[str] = []
-    items = sorted(
-        list(structure.items()),
-        key=lambda x: (isinstance(x[1], dict) and x[1].get("type") != "file", x[0]),
-    )
+    # Explicit stack of (items, next index, prefix) frames instead of recursion;
+    # a directory's frame is pushed right after its own line so its contents
+    # are emitted before its remaining siblings
+    stack: list[tuple[list[tuple[str, Any]], int, str]] = [
+        (_sorted_tree_items(structure), 0, prefix)
+    ]
+    while stack:
+        items, index, level_prefix = stack.pop()
+        if index >= len(items):
+            continue
 
-    for i, (name, info) in enumerate(items):
-        is_last = i == len(items) - 1
+        name, info = items[index]
+        is_last = index == len(items) - 1
         connector = "└─ " if is_last else "├─ "
+        stack.append((items, index + 1, level_prefix))
 
         if isinstance(info, dict) and info.get("type") == "file":
             icon = "📄 "
             file_info = f"{name} ({info['line_count']} lines) - {info['description']}"
-            lines.append(f"{prefix}{connector}{icon}{file_info}")
+            lines.append(f"{level_prefix}{connector}{icon}{file_info}")
         else:
             icon = "📁 "
-            lines.append(f"{prefix}{connector}{icon}{name}")
+            lines.append(f"{level_prefix}{connector}{icon}{name}")
             extension = "   " if is_last else "│  "
-            lines.extend(
-                structure_to_tree(
-                    info, prefix + extension, os.path.join(project_path, name)
-                )
-            )
+            stack.append((_sorted_tree_items(info), 0, level_prefix + extension))
 
     return lines
 
 
-def generate_focus_content(project_path: str, config: dict[str, Any]) -> str:
+def build_focus_header(project_path: str) -> str:
+    """Build the static header of the Focus file.
+
+    The header only depends on the project's identity, so long-running
+    monitors can build it once and pass it to :func:`generate_focus_content`
+    on every refresh.
+
+    Args:
+        project_path: Path to the project root directory
+
+    Returns:
+        str: Markdown with the project name, description, context and
+            guidelines, ending with the "Project Structure" heading line.
+    """
+    project_info = get_project_description(project_path)
+
+    buf = io.StringIO()
+    w = buf.write
+
+    name = project_info["name"]
+    description = project_info["description"]
+    key_features = project_info["key_features"]
+    w(f"# Project Focus: {name}\n")
+    w("\n")
+    w(f"**Current Goal:** {description}\n")
+    w("\n")
+    w("**Project Context:**\n")
+    w(f"Type: {key_features[1].replace('Type: ', '')}\n")
+    w(f"Target Users: Users of {name}\n")
+    w(f"Main Functionality: {description}\n")
+    w("Key Requirements:\n")
+    for feature in key_features:
+        w(f"- {feature}\n")
+    w("\n")
+    w("**Development Guidelines:**\n")
+    w("- Keep code modular and reusable\n")
+    w("- Follow best practices for the project type\n")
+    w("- Maintain clean separation of concerns\n")
+    w("\n")
+    w("# 📁 Project Structure\n")
+
+    return buf.getvalue()
+
+
+def generate_focus_content(
+    project_path: str, config: dict[str, Any], header: str | None = None
+) -> str:
     """Generate a comprehensive Focus file content for the project.
 
     Creates a detailed markdown document containing project information, structure,
@@ -201,6 +384,8 @@ def generate_focus_content(project_path: str, config: dict[str, Any]) -> str:
     Args:
         project_path: Path to the project root directory
         config: Configuration dictionary containing settings like max_depth
+        header: Optional header from :func:`build_focus_header`. Built from the
+            project when not given.
 
     Returns:
         str: Generated markdown content including:
@@ -217,38 +402,26 @@ def generate_focus_content(project_path: str, config: dict[str, Any]) -> str:
     """
     metrics = ProjectMetrics()
 
-    project_type = detect_project_type(project_path)
-    project_info = get_project_description(project_path)
+    if header is None:
+        header = build_focus_header(project_path)
 
-    content = [
-        f"# Project Focus: {project_info['name']}",
-        "",
-        f"**Current Goal:** {project_info['description']}",
-        "",
-        "**Project Context:**",
-        f"Type: {project_info['key_features'][1].replace('Type: ', '')}",
-        f"Target Users: Users of {project_info['name']}",
-        f"Main Functionality: {project_info['description']}",
-        "Key Requirements:",
-        *[f"- {feature}" for feature in project_info["key_features"]],
-        "",
-        "**Development Guidelines:**",
-        "- Keep code modular and reusable",
-        "- Follow best practices for the project type",
-        "- Maintain clean separation of concerns",
-        "",
-        "# 📁 Project Structure",
-    ]
+    # Lines go straight into one buffer instead of a list joined at the end
+    buf = io.StringIO()
+    w = buf.write
+    w(header)
 
     # Add directory structure with integrated file information
     structure = get_directory_structure(
         project_path, config["max_depth"], metrics=metrics
     )
-    content.extend(structure_to_tree(structure))
+    for line in structure_to_tree(structure):
+        w(line)
+        w("\n")
 
     # Add files with functions section
     if metrics.files_with_functions:
-        content.extend(["", "# 🔍 Key Files with Methods"])
+        w("\n")
+        w("# 🔍 Key Files with Methods\n")
 
         # Sort files by name
         metrics.files_with_functions.sort(key=lambda x: os.path.basename(x[0]).lower())
@@ -260,113 +433,30 @@ def generate_focus_content(project_path: str, config: dict[str, Any]) -> str:
             filtered_functions = [
                 func
                 for func, _ in functions
-                if not (
-                    func.startswith("__")
-                    or func
-                    in [
-                        "set",
-                        "get",
-                        "items",
-                        "exists",
-                        "enumerate",
-                        "input",
-                        "int",
-                        "next",
-                        "detection",
-                        "names",
-                        "walk",
-                        "endswith",
-                    ]
-                )
+                if not (func.startswith("__") or func in _BUILTIN_BLACKLIST)
             ]
 
             if filtered_functions:  # Only show files with non-special methods
-                content.extend(
-                    [
-                        "",
-                        f"`{rel_path}` ({line_count} lines)",
-                        "Functions:",
-                        *[f"- {func}" for func in sorted(filtered_functions)],
-                    ]
-                )
+                w("\n")
+                w(f"`{rel_path}` ({line_count} lines)\n")
+                w("Functions:\n")
+                for func in sorted(filtered_functions):
+                    w(f"- {func}\n")
 
     # Add metrics summary
-    file_dist = [
-        f"- {ext}: {count} files ({metrics.lines_by_type[ext]:,} lines)"
-        for ext, count in sorted(metrics.files_by_type.items())
-    ]
-
-    content.extend(
-        [
-            "",
-            "# 📊 Project Overview",
-            f"**Files:** {metrics.total_files}  |  **Lines:** {metrics.total_lines:,}",
-            "",
-            "## 📁 File Distribution",
-        ]
-        + file_dist
-        + ["", f"*Updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}*"]
-    )
-
-    return "\n".join(content)
-
-
-def analyze_file_content(file_path: str) -> tuple[list[tuple[str, str]], int]:
-    """Analyze file content for functions and their descriptions.
-
-    This function reads a file and attempts to detect function definitions using regex patterns.
-    It skips binary files and files with non-code extensions.
-
-    Args:
-        file_path: Path to the file to analyze.
-
-    Returns:
-        Tuple containing:
-            - List[Tuple[str, str]]: List of tuples where each tuple contains:
-                - Function name (str)
-                - Function description (str)
-            - int: Total number of lines in the file
-
-    Note:
-        Returns empty list and 0 lines if file is binary, non-code, or encounters an error.
-    """
-    try:
-        # Skip binary and non-code files
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext not in CODE_EXTENSIONS:
-            return [], 0
-
-        # Skip binary files
-        if is_binary_file(file_path):
-            return [], 0
-
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        functions = []
-        for pattern_name, pattern in FUNCTION_PATTERNS.items():
-            try:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    func_name = next(filter(None, match.groups()), None)
-                    if func_name and func_name not in IGNORED_KEYWORDS:
-                        functions.append((func_name, "Function detected"))
-            except re.error as e:
-                logging.debug(
-                    f"Invalid regex pattern {pattern_name} for {file_path}: {e}"
-                )
-                continue
-            except Exception as e:
-                logging.debug(
-                    f"Error analyzing pattern {pattern_name} for {file_path}: {e}"
-                )
-                continue
-
-        return functions, len(content.splitlines())
-
-    except UnicodeDecodeError:
-        logging.debug(f"Unable to read {file_path} as text file")
-        return [], 0
-    except Exception as e:
-        logging.debug(f"Error analyzing file {file_path}: {e}")
-        return [], 0
+    w("\n")
+    w("# 📊 Project Overview\n")
+    w(f"**Files:** {metrics.total_files}  |  **Lines:** {metrics.total_lines:,}\n")
+    w("\n")
+    w("## 📁 File Distribution\n")
+    for ext, count in sorted(metrics.files_by_type.items()):
+        w(f"- {ext}: {count} files ({metrics.lines_by_type[ext]:,} lines)\n")
+    w("\n")
+    w(f"*Updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}*")
+
+    return buf.getvalue()
+
+
+# Kept for callers of the old name; analysis lives in one place, the cached
+# and per-language analyzer in analyzers.py
+analyze_file_content = analyze_file_content_and_desc
@@ -1,21 +1,213 @@
+import asyncio
+import hashlib
 import logging
+import multiprocessing
 import os
+import random
+import signal
+import sys
 import time
-from datetime import datetime
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Any, Dict, Optional
 
+from contextforge_cli.vendored.cursorfocus.analyzers import should_ignore_file
 from contextforge_cli.vendored.cursorfocus.auto_updater import AutoUpdater
 from contextforge_cli.vendored.cursorfocus.config import get_default_config, load_config
 from contextforge_cli.vendored.cursorfocus.content_generator import (
+    _scan_directory,
+    build_focus_header,
     generate_focus_content,
 )
+from contextforge_cli.vendored.cursorfocus.project_detector import (
+    get_project_description,
+)
 from contextforge_cli.vendored.cursorfocus.rules_analyzer import RulesAnalyzer
 from contextforge_cli.vendored.cursorfocus.rules_generator import RulesGenerator
-from contextforge_cli.vendored.cursorfocus.rules_watcher import ProjectWatcherManager
+from contextforge_cli.vendored.cursorfocus.rules_watcher import (
+    ChangeTracker,
+    ProjectWatcherManager,
+)
+
+# Progress reported by the monitor loops; start_log_listener() routes it through
+# a queue so the loops only enqueue a record and never block on stdout
+logger = logging.getLogger(__name__)
+
+
+class _MinuteFormatter(logging.Formatter):
+    """Formatter stamping records with the time of day as HH:MM.
+
+    The stamp is formatted once per minute and reused for every record
+    logged within that minute.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        """Initialize the formatter with an empty time cache.
+
+        Args:
+            fmt: Format string, may reference ``%(asctime)s``
+        """
+        super().__init__(fmt)
+        self._minute: int = -1
+        self._stamp: str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the HH:MM stamp for a record's creation time.
+
+        Args:
+            record: Record being formatted
+            datefmt: Ignored; the stamp is always HH:MM
+
+        Returns:
+            str: Local time of day the record was created
+        """
+        minute = int(record.created // 60)
+        if minute != self._minute:
+            self._stamp = time.strftime("%H:%M", time.localtime(record.created))
+            self._minute = minute
+        return self._stamp
+
+
+# Listener started by start_log_listener, the handler feeding it, the number
+# of callers using it and the logger settings to restore once it stops
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+_listener_users: int = 0
+_saved_logger_state: tuple[int, bool] = (logging.NOTSET, True)
+
+
+def start_log_listener() -> QueueListener:
+    """Route this module's log records to stdout through a queue.
+
+    The calling thread only puts the record on a queue; formatting and writing
+    happen on the listener's own thread. Records are stamped with the time of
+    day, e.g. ``✓ project (14:05)``.
+
+    The listener is shared: calling this while it runs returns the running
+    listener, and each call must be paired with :func:`stop_log_listener`.
+
+    Returns:
+        QueueListener: The running listener
+    """
+    global _listener, _queue_handler, _listener_users, _saved_logger_state
+    _listener_users += 1
+    if _listener is not None:
+        return _listener
+
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_MinuteFormatter("%(message)s (%(asctime)s)"))
+    _listener = QueueListener(queue, handler)
+    _queue_handler = QueueHandler(queue)
+
+    _saved_logger_state = (logger.level, logger.propagate)
+    logger.addHandler(_queue_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _listener.start()
+    return _listener
+
+
+def stop_log_listener() -> None:
+    """Release the listener started by :func:`start_log_listener`.
+
+    Once the last user releases it, queued records are flushed, the handler is
+    detached and the logger's level and propagation are restored.
+    """
+    global _listener, _queue_handler, _listener_users
+    if _listener is None:
+        return
+    _listener_users -= 1
+    if _listener_users > 0:
+        return
+
+    logger.removeHandler(_queue_handler)
+    level, logger.propagate = _saved_logger_state
+    logger.setLevel(level)
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
+
+
+def write_focus_file(focus_file: str, content: str | bytes) -> None:
+    """Atomically replace the Focus file with new content.
+
+    The content is written to a temporary file beside the target, which is
+    then swapped in with ``os.replace`` so readers never see a partially
+    written Focus.md.
+
+    Args:
+        focus_file: Path of the Focus.md file to write
+        content: Markdown content to write, as text or already UTF-8 encoded
+
+    Raises:
+        OSError: If the file cannot be written or replaced
+    """
+    tmp_file = f"{focus_file}.tmp"
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    with open(tmp_file, "wb") as f:
+        f.write(content)
+    os.replace(tmp_file, focus_file)
+
+
+# Capped exponential backoff for retries, in seconds
+BACKOFF_BASE: float = 1.0
+MAX_BACKOFF: float = 30.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Compute the jittered delay before a retry.
+
+    Args:
+        attempt: Number of the failed attempt, starting at 1
+
+    Returns:
+        float: ``BACKOFF_BASE * 2**(attempt - 1)`` capped at ``MAX_BACKOFF`` and
+            scaled by a random factor in [0.5, 1.5) so concurrent retries
+            spread out.
+    """
+    return min(MAX_BACKOFF, BACKOFF_BASE * (2 ** (attempt - 1))) * (
+        0.5 + random.random()
+    )
+
+
+def _project_fingerprint(project_path: str, max_depth: int) -> int:
+    """Fingerprint the code files of a project from file metadata only.
+
+    Uses the same directory scan as the Focus.md structure, so it covers
+    exactly the rendered files: churn in e.g. ``dist/`` or below
+    ``max_depth`` does not force a regeneration, while files under symlinked
+    directories still count.
+
+    Args:
+        project_path: Path to the project root directory
+        max_depth: Maximum directory depth rendered into Focus.md
+
+    Returns:
+        int: Order-independent combination of every code file's path,
+            modification time and size; changes whenever a code file is
+            added, removed or modified. No file is opened.
+    """
+    pending: list[tuple[dict[str, Any], str, str, str]] = []
+    _scan_directory(project_path, max_depth, 0, pending)
+    fingerprint = 0
+    for _, _, path, _ in pending:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Removed while walking
+            continue
+        fingerprint ^= hash((path, stat.st_mtime_ns, stat.st_size))
+    return fingerprint
 
 
 def retry_generate_rules(
-    project_path: str, project_name: str, max_retries: int = 3
+    project_path: str,
+    project_name: str,
+    max_retries: int = 3,
+    format_choice: str | None = None,
 ) -> str | None:
     """Retry generating rules file automatically with exponential backoff.
 
@@ -26,6 +218,8 @@ def retry_generate_rules(
         project_path: Path to the project root directory
         project_name: Name of the project for display purposes
         max_retries: Maximum number of retry attempts (default: 3)
+        format_choice: Rules file format, "json" or "markdown". If not
+            provided, the user is prompted for it.
 
     Returns:
         Optional[str]: Path to the generated rules file if successful,
@@ -35,8 +229,9 @@ def retry_generate_rules(
         Exception: If all retry attempts fail
 
     Note:
-        - Uses exponential backoff between retries (2^n seconds)
-        - Prompts user to choose between JSON and Markdown format
+        - Uses capped exponential backoff with jitter between retries
+        - Prompts user to choose between JSON and Markdown format unless
+          format_choice is given; the answer is reused on retries
         - Displays progress and error information during retries
     """
     retries = 0
@@ -47,18 +242,19 @@ def retry_generate_rules(
             project_info = analyzer.analyze_project_for_rules()
 
             # Ask for format preference using numbers
-            print("\nSelect format for .cursorrules file:")
-            print("1. JSON")
-            print("2. Markdown")
-            while True:
-                try:
-                    choice = int(input("Enter selection (1-2): "))
-                    if choice in [1, 2]:
-                        format_choice = "json" if choice == 1 else "markdown"
-                        break
-                    print("Please enter 1 or 2")
-                except ValueError:
-                    print("Please enter a number")
+            if format_choice is None:
+                print("\nSelect format for .cursorrules file:")
+                print("1. JSON")
+                print("2. Markdown")
+                while True:
+                    try:
+                        choice = int(input("Enter selection (1-2): "))
+                        if choice in [1, 2]:
+                            format_choice = "json" if choice == 1 else "markdown"
+                            break
+                        print("Please enter 1 or 2")
+                    except ValueError:
+                        print("Please enter a number")
 
             rules_generator = RulesGenerator(project_path)
             rules_file = rules_generator.generate_rules_file(
@@ -69,9 +265,9 @@ def retry_generate_rules(
         except Exception as e:
             retries += 1
             if retries < max_retries:
-                wait_time = 2 * (2 ** (retries - 1))  # Exponential backoff
+                wait_time = _backoff_delay(retries)
                 print(
-                    f"\n⚠️ Error occurred, automatically retrying in {wait_time} seconds... (attempt {retries}/{max_retries})"
+                    f"\n⚠️ Error occurred, automatically retrying in {wait_time:.1f} seconds... (attempt {retries}/{max_retries})"
                 )
                 print(f"Error details: {str(e)}")
                 time.sleep(wait_time)
@@ -83,7 +279,13 @@ def retry_generate_rules(
                 raise
 
 
-def setup_cursor_focus(project_path: str, project_name: str | None = None) -> None:
+def setup_cursor_focus(
+    project_path: str,
+    project_name: str | None = None,
+    default_config: dict[str, Any] | None = None,
+    auto_update_rules: bool | None = None,
+    rules_format: str | None = None,
+) -> None:
     """Set up CursorFocus for a project by generating or updating necessary files.
 
     This function handles the initial setup or update of CursorFocus configuration files
@@ -93,6 +295,13 @@ def setup_cursor_focus(project_path: str, project_name: str | None = None) -> No
         project_path: Path to the project root directory
         project_name: Optional name of the project for display purposes.
             If not provided, will use generic "project" in messages.
+        default_config: Optional default configuration used for the initial
+            Focus.md. Built with get_default_config() if not provided, so
+            callers setting up many projects can build it once and share it.
+        auto_update_rules: Whether to regenerate an existing .cursorrules file.
+            If not provided, the user is asked.
+        rules_format: Rules file format, "json" or "markdown". If not
+            provided, the user is asked.
 
     Returns:
         None
@@ -102,6 +311,7 @@ def setup_cursor_focus(project_path: str, project_name: str | None = None) -> No
 
     Note:
         - Checks for existing .cursorrules file and prompts for update
+        - Runs without prompts when auto_update_rules and rules_format are set
         - Generates new rules file with retry mechanism
         - Creates initial Focus.md using default configuration
     """
@@ -111,19 +321,22 @@ def setup_cursor_focus(project_path: str, project_name: str | None = None) -> No
 
         if os.path.exists(rules_file):
             print(f"\nRules file exists for {project_name or 'project'}")
-            response = input("Update rules? (y/n): ").lower()
-            if response != "y":
+            if auto_update_rules is None:
+                auto_update_rules = input("Update rules? (y/n): ").lower() == "y"
+            if not auto_update_rules:
                 return
 
         # Generate/Update .cursorrules file with retry mechanism
-        rules_file = retry_generate_rules(project_path, project_name)
+        rules_file = retry_generate_rules(
+            project_path, project_name, format_choice=rules_format
+        )
 
         # Generate initial Focus.md with default config
         focus_file = os.path.join(project_path, "Focus.md")
-        default_config = get_default_config()
+        if default_config is None:
+            default_config = get_default_config()
         content = generate_focus_content(project_path, default_config)
-        with open(focus_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        write_focus_file(focus_file, content)
         print(f"✓ {os.path.basename(focus_file)}")
 
     except Exception as e:
@@ -131,14 +344,18 @@ def setup_cursor_focus(project_path: str, project_name: str | None = None) -> No
         raise
 
 
-def monitor_project(
-    project_config: dict[str, Any], global_config: dict[str, Any]
+async def monitor_project(
+    project_config: dict[str, Any],
+    global_config: dict[str, Any],
+    watcher: ProjectWatcherManager | None = None,
+    executor: Executor | None = None,
 ) -> None:
     """Monitor a single project for changes and update Focus.md accordingly.
 
-    This function continuously monitors a project directory for changes and updates
+    This coroutine continuously monitors a project directory for changes and updates
     the Focus.md file when changes are detected. It also manages the rules watcher
-    for the project.
+    for the project. Blocking work (scanning, generating, writing) runs in worker
+    threads so many projects can share one event loop.
 
     Args:
         project_config: Project-specific configuration dictionary containing:
@@ -147,13 +364,22 @@ def monitor_project(
             - update_interval: Time between checks (optional)
             - Other project-specific settings
         global_config: Global configuration dictionary that applies to all projects
+        watcher: Optional shared watcher manager; a private one is created if
+            not given
+        executor: Optional executor for generating Focus.md content, e.g. a
+            process pool; the loop's default thread pool is used if not given
 
     Returns:
         None
 
     Note:
         - Runs indefinitely until interrupted
+        - Sleeps until file system events report a change, waiting for
+          bursts of events to settle (debounce_ms, default 250)
+        - Regenerates at most once per update interval
         - Updates Focus.md only when content changes
+        - A write in progress when the coroutine is cancelled is completed
+          before it exits
         - Uses project-specific update interval from config
         - Merges project config with global config
     """
@@ -161,36 +387,268 @@ def monitor_project(
     project_name = project_config["name"]
     print(f"👀 {project_name}")
 
-    # Merge project config with global config
+    # Merge project config with global config once; the list of all projects
+    # is not needed per project and would be copied to a worker process on
+    # every pass
     config = {**global_config, **project_config}
+    config.pop("projects", None)
 
     focus_file = os.path.join(project_path, "Focus.md")
-    last_content = None
-    last_update = 0
+    last_digest: bytes | None = None
+    last_fingerprint: int | None = None
+    loop = asyncio.get_running_loop()
+    # loop.time() has an arbitrary epoch, so the first pass must not be throttled
+    last_update = float("-inf")
 
     # Start rules watcher for this project
+    if watcher is None:
+        watcher = ProjectWatcherManager()
+    project_id = watcher.add_project(project_path, project_name)
+
+    update_interval = config.get("update_interval", 60)
+    debounce = config.get("debounce_ms", 250) / 1000
+
+    # Editors fire several events per save, so the wake-up is debounced: each
+    # event restarts the timer, and the pass runs once the burst goes quiet.
+    # A burst longer than the update interval is not postponed any further.
+    changed = asyncio.Event()
+    pending: asyncio.TimerHandle | None = None
+    burst_start = 0.0
+
+    def fire() -> None:
+        nonlocal pending
+        pending = None
+        changed.set()
+
+    def schedule_update() -> None:
+        nonlocal pending, burst_start
+        if pending is None:
+            burst_start = loop.time()
+        elif loop.time() - burst_start < update_interval:
+            pending.cancel()
+        else:
+            return
+        pending = loop.call_later(debounce, fire)
+
+    # File system events mark the project dirty and wake this coroutine from
+    # the observer thread; the first pass always runs. Churn under ignored
+    # directories (.git, node_modules, ...) and our own writes to Focus.md
+    # are dropped, so publishing an update does not trigger another pass.
+    tracker = ChangeTracker(
+        project_path,
+        ignore=should_ignore_file,
+        on_change=lambda: loop.call_soon_threadsafe(schedule_update),
+        ignored_paths=(focus_file, f"{focus_file}.tmp"),
+    )
+    watcher.watch_changes(project_id, tracker)
+    tracker.mark_dirty(project_path)
+
+    # The header only changes with the project root (where manifests live),
+    # so it is rebuilt on the first pass and whenever the root is dirty
+    project_root = os.path.normpath(project_path)
+    header: str | None = None
+
+    # Report updates even when not started through main()
+    start_log_listener()
+    try:
+        while True:
+            # Sleep until the watcher reports a change instead of polling
+            await changed.wait()
+
+            # Regenerate at most once per interval; changes arriving meanwhile
+            # are coalesced into the same pass
+            remaining = last_update + update_interval - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+            last_update = loop.time()
+
+            changed.clear()
+            dirty = tracker.pop_dirty()
+            if not dirty:
+                continue
+
+            header_changed = False
+            if header is None or project_root in {os.path.normpath(p) for p in dirty}:
+                get_project_description.cache_clear()
+                new_header = await asyncio.to_thread(build_focus_header, project_path)
+                header_changed = new_header != header
+                header = new_header
+
+            # Events also fire for files that do not affect Focus.md; a stat-only
+            # walk is far cheaper than regenerating to find that out
+            fingerprint = await asyncio.to_thread(
+                _project_fingerprint, project_path, config["max_depth"]
+            )
+            if fingerprint == last_fingerprint and not header_changed:
+                continue
+            last_fingerprint = fingerprint
+
+            content = await loop.run_in_executor(
+                executor, generate_focus_content, project_path, config, header
+            )
+            # Encoded once; the same bytes are hashed and written
+            data = content.encode("utf-8")
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+
+            if digest != last_digest:
+                write = asyncio.ensure_future(
+                    asyncio.to_thread(write_focus_file, focus_file, data)
+                )
+                try:
+                    await asyncio.shield(write)
+                    last_digest = digest
+                    logger.info("✓ %s", project_name)
+                except asyncio.CancelledError:
+                    # Shutting down mid-write: let the write finish so no stray
+                    # Focus.md.tmp is left behind, then stop
+                    await asyncio.gather(write, return_exceptions=True)
+                    raise
+                except Exception as e:
+                    # Try again on the next pass
+                    last_fingerprint = None
+                    tracker.mark_dirty(project_path)
+                    logger.error("❌ %s: %s", project_name, e)
+
+    finally:
+        stop_log_listener()
+
+
+async def monitor_projects(
+    projects: list[dict[str, Any]], global_config: dict[str, Any]
+) -> None:
+    """Monitor several projects concurrently on one event loop.
+
+    Args:
+        projects: Project configuration dictionaries to monitor
+        global_config: Global configuration dictionary that applies to all projects
+
+    Note:
+        Runs until cancelled or until SIGINT/SIGTERM is received, which return
+        normally; all watchers are stopped on the way out. Setting
+        generation_processes in the config generates content in that many
+        worker processes, so projects regenerating at the same time use
+        separate cores.
+    """
+    loop = asyncio.get_running_loop()
+
+    # The loop sleeps in the selector until a signal arrives; where signal
+    # handlers cannot be installed (Windows, non-main thread) Ctrl+C still
+    # raises KeyboardInterrupt as before
+    stop = asyncio.Event()
+    handled_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+            handled_signals.append(sig)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+
+    # Workers are spawned rather than forked, as the observer threads are
+    # already running
+    executor = None
+    processes = global_config.get("generation_processes", 0)
+    if processes > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=min(processes, len(projects)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
     watcher = ProjectWatcherManager()
-    watcher.add_project(project_path, project_name)
+    monitors = asyncio.gather(
+        *(
+            monitor_project(project, global_config, watcher, executor)
+            for project in projects
+        )
+    )
+    stopped = asyncio.ensure_future(stop.wait())
+    try:
+        await asyncio.wait({monitors, stopped}, return_when=asyncio.FIRST_COMPLETED)
+        if monitors.done():
+            # A monitor failed; propagate its exception
+            monitors.result()
+    finally:
+        monitors.cancel()
+        stopped.cancel()
+        await asyncio.gather(monitors, stopped, return_exceptions=True)
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+        watcher.stop_all()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _setup_options(
+    project: dict[str, Any], global_config: dict[str, Any]
+) -> dict[str, Any]:
+    """Collect the setup answers a project configures instead of prompting.
 
-    while True:
-        current_time = time.time()
+    Args:
+        project: Project configuration dictionary
+        global_config: Global configuration used for keys the project omits
 
-        if current_time - last_update < config.get("update_interval", 60):
-            time.sleep(1)
-            continue
+    Returns:
+        Dict[str, Any]: Keyword arguments for setup_cursor_focus
+    """
+    return {
+        "auto_update_rules": project.get(
+            "auto_update_rules", global_config.get("auto_update_rules")
+        ),
+        "rules_format": project.get("rules_format", global_config.get("rules_format")),
+    }
+
+
+def setup_projects(
+    projects: list[dict[str, Any]],
+    global_config: dict[str, Any],
+    default_config: dict[str, Any] | None = None,
+) -> None:
+    """Set up several projects, concurrently where no prompt is needed.
+
+    Projects whose setup answers are all configured are set up in a thread
+    pool, since the work is mostly file I/O; the rest run one at a time
+    afterwards so their prompts do not interleave.
+
+    Args:
+        projects: Configurations of projects that exist on disk
+        global_config: Global configuration dictionary
+        default_config: Optional default configuration shared by all setups
 
-        content = generate_focus_content(project_path, config)
+    Note:
+        A failed setup is reported and does not stop the other projects.
+    """
+    if default_config is None:
+        default_config = get_default_config()
 
-        if content != last_content:
-            try:
-                with open(focus_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                last_content = content
-                print(f"✓ {project_name} ({datetime.now().strftime('%H:%M')})")
-            except Exception as e:
-                print(f"❌ {project_name}: {e}")
+    def setup(project: dict[str, Any]) -> None:
+        try:
+            setup_cursor_focus(
+                project["project_path"],
+                project["name"],
+                default_config,
+                **_setup_options(project, global_config),
+            )
+        except Exception:
+            # Already reported by setup_cursor_focus
+            pass
 
-        last_update = current_time
+    unattended = []
+    interactive = []
+    for project in projects:
+        options = _setup_options(project, global_config)
+        rules_file = os.path.join(project["project_path"], ".cursorrules")
+        if options["rules_format"] is not None and (
+            options["auto_update_rules"] is not None or not os.path.exists(rules_file)
+        ):
+            unattended.append(project)
+        else:
+            interactive.append(project)
+
+    if unattended:
+        with ThreadPoolExecutor(max_workers=min(8, len(unattended))) as executor:
+            list(executor.map(setup, unattended))
+    for project in interactive:
+        setup(project)
 
 
 def main() -> None:
@@ -206,18 +664,28 @@ def main() -> None:
         None
 
     Note:
-        - Checks for updates before starting
+        - Checks for updates before starting, at most once per
+          update_check_ttl seconds (default: one day)
         - Uses default config if no config.json found
-        - Monitors multiple projects concurrently using threads
+        - Skips the setup prompts for projects that set auto_update_rules
+          and rules_format (per project or globally) and sets those up
+          concurrently
+        - Monitors multiple projects concurrently on a single asyncio event loop
         - Runs until interrupted with Ctrl+C
-        - All monitoring threads are daemonized
     """
     logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
 
-    # Check updates
+    config = load_config()
+    if not config:
+        print("No config.json found, using default configuration")
+        config = get_default_config()
+
+    # Check updates; a check newer than update_check_ttl seconds is reused
     print("\n🔄 Checking updates...")
     updater = AutoUpdater()
-    update_info = updater.check_for_updates()
+    update_info = updater.check_for_updates(
+        max_age=config.get("update_check_ttl", 86400)
+    )
 
     if update_info:
         print(f"📦 Update available: {update_info['message']}")
@@ -237,11 +705,6 @@ def main() -> None:
     else:
         print("✓ Latest version")
 
-    config = load_config()
-    if not config:
-        print("No config.json found, using default configuration")
-        config = get_default_config()
-
     if "projects" not in config:
         config["projects"] = [
             {
@@ -255,41 +718,35 @@ def main() -> None:
             }
         ]
 
-    from threading import Thread
-
-    threads = []
-
+    start_log_listener()
     try:
-        # Setup projects
+        # Check each project path once; setup and monitoring share the result
+        projects = []
         for project in config["projects"]:
             if os.path.exists(project["project_path"]):
-                setup_cursor_focus(project["project_path"], project["name"])
+                projects.append(project)
             else:
                 print(f"⚠️ Not found: {project['project_path']}")
-                continue
 
-        # Start monitoring
-        for project in config["projects"]:
-            if os.path.exists(project["project_path"]):
-                thread = Thread(
-                    target=monitor_project, args=(project, config), daemon=True
-                )
-                thread.start()
-                threads.append(thread)
+        # Setup projects; the default config is built once and shared by all
+        setup_projects(projects, config, get_default_config())
 
-        if not threads:
+        if not projects:
             print("❌ No projects to monitor")
             return
 
-        print(f"\n📝 Monitoring {len(threads)} projects (Ctrl+C to stop)")
+        print(f"\n📝 Monitoring {len(projects)} projects (Ctrl+C to stop)")
 
-        while True:
-            time.sleep(1)
+        # Start monitoring; returns once SIGINT or SIGTERM is received
+        asyncio.run(monitor_projects(projects, config))
+        print("\n👋 Bye!")
 
     except KeyboardInterrupt:
         print("\n👋 Bye!")
     except Exception as e:
         print(f"\n❌ Error: {e}")
+    finally:
+        stop_log_listener()
 
 
 if __name__ == "__main__":
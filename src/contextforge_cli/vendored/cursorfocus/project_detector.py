@@ -1,11 +1,16 @@
+import fnmatch
+import functools
 import json
 import os
 import re
 import time
-from collections.abc import Callable
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict, Union
 
-from contextforge_cli.vendored.cursorfocus.config import load_config
+from contextforge_cli.vendored.cursorfocus.config import IGNORED_NAMES
 
 
 class ProjectInfo(TypedDict):
@@ -28,34 +33,51 @@ class ProjectInfo(TypedDict):
     path: str
 
 
-class ProjectTypeInfo(TypedDict):
-    """Type definition for project type configuration.
+@dataclass(frozen=True, slots=True)
+class ProjectTypeInfo:
+    """Detection rules for one project type.
+
+    Unknown rule names fail at construction, so a misspelt key in
+    PROJECT_TYPES is an import-time TypeError instead of a silently ignored
+    check.
 
     Attributes:
         description: Human-readable description of the project type
-        indicators: List of files/patterns that indicate this project type
-        file_patterns: List of file patterns associated with this type
-        required_files: List of files that must be present
+        indicators: Files/patterns that indicate this project type
+        file_patterns: File patterns associated with this type
+        required_files: Files that must be present
         priority: Priority level for detection (higher = more specific)
-        additional_checks: Optional list of callable checks
+        required_extensions: Optional extensions of which at least one must
+            appear on a file in the project root
     """
 
     description: str
-    indicators: list[str]
-    file_patterns: list[str]
-    required_files: list[str]
-    priority: int
-    additional_checks: list[Callable[[str], bool]] | None
-
+    indicators: tuple[str, ...] = ()
+    file_patterns: tuple[str, ...] = ()
+    required_files: tuple[str, ...] = ()
+    priority: int = 0
+    required_extensions: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        """Reject extensions written without their leading dot.
+
+        Raises:
+            ValueError: If an entry of required_extensions does not start
+                with ``"."``, as it could never match a file
+        """
+        for ext in self.required_extensions:
+            if not ext.startswith("."):
+                raise ValueError(
+                    f"required extension {ext!r} of {self.description!r} "
+                    "must start with '.'"
+                )
 
-# Load project types from config at module level
-_config: dict[str, Any] | None = load_config()
 
 # Project type definitions with improved structure
 PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
-    "python": {
-        "description": "Python Project",
-        "indicators": [
+    "python": ProjectTypeInfo(
+        description="Python Project",
+        indicators=(
             "setup.py",
             "requirements.txt",
             "Pipfile",
@@ -63,21 +85,15 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             "poetry.lock",
             "venv/",
             ".venv/",
-        ],
-        "file_patterns": ["*.py"],
-        "required_files": [],
-        "priority": 10,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".py")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "java": {
-        "description": "Java Project",
-        "indicators": [
+        ),
+        file_patterns=("*.py",),
+        required_files=(),
+        priority=10,
+        required_extensions=frozenset({".py"}),
+    ),
+    "java": ProjectTypeInfo(
+        description="Java Project",
+        indicators=(
             "pom.xml",
             "build.gradle",
             "gradlew",
@@ -85,35 +101,23 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             "src/main/java/",
             "target/",
             "META-INF/",
-        ],
-        "file_patterns": ["*.java", "*.jar", "*.war"],
-        "required_files": [],
-        "priority": 7,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".java")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "go": {
-        "description": "Go Project",
-        "indicators": ["go.mod", "go.sum", "main.go", "pkg/", "cmd/", "internal/"],
-        "file_patterns": ["*.go"],
-        "required_files": [],
-        "priority": 7,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".go")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "ruby": {
-        "description": "Ruby Project",
-        "indicators": [
+        ),
+        file_patterns=("*.java", "*.jar", "*.war"),
+        required_files=(),
+        priority=7,
+        required_extensions=frozenset({".java"}),
+    ),
+    "go": ProjectTypeInfo(
+        description="Go Project",
+        indicators=("go.mod", "go.sum", "main.go", "pkg/", "cmd/", "internal/"),
+        file_patterns=("*.go",),
+        required_files=(),
+        priority=7,
+        required_extensions=frozenset({".go"}),
+    ),
+    "ruby": ProjectTypeInfo(
+        description="Ruby Project",
+        indicators=(
             "Gemfile",
             "Rakefile",
             ".ruby-version",
@@ -121,41 +125,29 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             "bin/rails",
             "app/",
             "lib/",
-        ],
-        "file_patterns": ["*.rb", "*.erb", "*.rake"],
-        "required_files": [],
-        "priority": 6,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".rb")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "rust": {
-        "description": "Rust Project",
-        "indicators": [
+        ),
+        file_patterns=("*.rb", "*.erb", "*.rake"),
+        required_files=(),
+        priority=6,
+        required_extensions=frozenset({".rb"}),
+    ),
+    "rust": ProjectTypeInfo(
+        description="Rust Project",
+        indicators=(
             "Cargo.toml",
             "Cargo.lock",
             "src/main.rs",
             "src/lib.rs",
             "target/",
-        ],
-        "file_patterns": ["*.rs"],
-        "required_files": [],
-        "priority": 7,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".rs")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "dart": {
-        "description": "Dart/Flutter Project",
-        "indicators": [
+        ),
+        file_patterns=("*.rs",),
+        required_files=(),
+        priority=7,
+        required_extensions=frozenset({".rs"}),
+    ),
+    "dart": ProjectTypeInfo(
+        description="Dart/Flutter Project",
+        indicators=(
             "pubspec.yaml",
             "pubspec.lock",
             ".dart_tool/",
@@ -163,40 +155,28 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             "ios/",
             "lib/",
             "test/",
-        ],
-        "file_patterns": ["*.dart"],
-        "required_files": [],
-        "priority": 6,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".dart")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "scala": {
-        "description": "Scala Project",
-        "indicators": [
+        ),
+        file_patterns=("*.dart",),
+        required_files=(),
+        priority=6,
+        required_extensions=frozenset({".dart"}),
+    ),
+    "scala": ProjectTypeInfo(
+        description="Scala Project",
+        indicators=(
             "build.sbt",
             "project/build.properties",
             ".scala-build/",
             "src/main/scala/",
-        ],
-        "file_patterns": ["*.scala"],
-        "required_files": [],
-        "priority": 6,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".scala")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "javascript": {
-        "description": "JavaScript/Node.js Project",
-        "indicators": [
+        ),
+        file_patterns=("*.scala",),
+        required_files=(),
+        priority=6,
+        required_extensions=frozenset({".scala"}),
+    ),
+    "javascript": ProjectTypeInfo(
+        description="JavaScript/Node.js Project",
+        indicators=(
             "package.json",
             "package-lock.json",
             "yarn.lock",
@@ -205,42 +185,30 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             ".npmrc",
             ".nvmrc",
             "next.config.js",
-        ],
-        "file_patterns": ["*.js", "*.jsx", "*.mjs", "*.cjs"],
-        "required_files": [],
-        "priority": 5,
-        "additonal_checks": [
-            lambda path: any(
-                f.endswith((".js", ".jsx", ".mjs", ".cjs"))
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "typescript": {
-        "description": "TypeScript Project",
-        "indicators": [
+        ),
+        file_patterns=("*.js", "*.jsx", "*.mjs", "*.cjs"),
+        required_files=(),
+        priority=5,
+        required_extensions=frozenset({".js", ".jsx", ".mjs", ".cjs"}),
+    ),
+    "typescript": ProjectTypeInfo(
+        description="TypeScript Project",
+        indicators=(
             "tsconfig.json",
             "tslint.json",
             "typescript.json",
             ".ts",
             ".tsx",
             ".eslintrc",
-        ],
-        "file_patterns": ["*.ts", "*.tsx"],
-        "required_files": [],
-        "priority": 6,  # Higher than JS because TS projects often have JS files too
-        "additional_checks": [
-            lambda path: any(
-                f.endswith((".ts", ".tsx"))
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "web": {
-        "description": "Web Project",
-        "indicators": [
+        ),
+        file_patterns=("*.ts", "*.tsx"),
+        required_files=(),
+        priority=6,  # Higher than JS because TS projects often have JS files too
+        required_extensions=frozenset({".ts", ".tsx"}),
+    ),
+    "web": ProjectTypeInfo(
+        description="Web Project",
+        indicators=(
             "index.html",
             "styles.css",
             ".html",
@@ -248,49 +216,37 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             "public/",
             "assets/",
             "images/",
-        ],
-        "file_patterns": ["*.html", "*.css", "*.scss", "*.sass", "*.less", "*.svg"],
-        "required_files": [],
-        "priority": 3,
-    },
-    "php": {
-        "description": "PHP Project",
-        "indicators": ["composer.json", "composer.lock", "artisan", ".php", "vendor/"],
-        "file_patterns": ["*.php"],
-        "required_files": [],
-        "priority": 5,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".php")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "cpp": {
-        "description": "C++ Project",
-        "indicators": [
+        ),
+        file_patterns=("*.html", "*.css", "*.scss", "*.sass", "*.less", "*.svg"),
+        required_files=(),
+        priority=3,
+    ),
+    "php": ProjectTypeInfo(
+        description="PHP Project",
+        indicators=("composer.json", "composer.lock", "artisan", ".php", "vendor/"),
+        file_patterns=("*.php",),
+        required_files=(),
+        priority=5,
+        required_extensions=frozenset({".php"}),
+    ),
+    "cpp": ProjectTypeInfo(
+        description="C++ Project",
+        indicators=(
             "CMakeLists.txt",
             "makefile",
             "Makefile",
             ".sln",
             ".vcxproj",
             "compile_commands.json",
-        ],
-        "file_patterns": ["*.cpp", "*.hpp", "*.cc", "*.h", "*.cxx", "*.hxx"],
-        "required_files": [],
-        "priority": 5,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith((".cpp", ".hpp", ".cc", ".cxx", ".h", ".hxx"))
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "csharp": {
-        "description": "C# Project",
-        "indicators": [
+        ),
+        file_patterns=("*.cpp", "*.hpp", "*.cc", "*.h", "*.cxx", "*.hxx"),
+        required_files=(),
+        priority=5,
+        required_extensions=frozenset({".cpp", ".hpp", ".cc", ".cxx", ".h", ".hxx"}),
+    ),
+    "csharp": ProjectTypeInfo(
+        description="C# Project",
+        indicators=(
             ".sln",
             ".csproj",
             ".cs",
@@ -298,38 +254,118 @@ PROJECT_TYPES: dict[str, ProjectTypeInfo] = {
             "NuGet.Config",
             "bin/Debug/",
             "bin/Release/",
-        ],
-        "file_patterns": ["*.cs"],
-        "required_files": [],
-        "priority": 5,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith(".cs")
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
-    "kotlin": {
-        "description": "Kotlin Project",
-        "indicators": ["*.kt", "build.gradle.kts", ".kt"],
-        "file_patterns": ["*.kt", "*.kts"],
-        "required_files": [],
-        "priority": 5,
-        "additional_checks": [
-            lambda path: any(
-                f.endswith((".kt", ".kts"))
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            )
-        ],
-    },
+        ),
+        file_patterns=("*.cs",),
+        required_files=(),
+        priority=5,
+        required_extensions=frozenset({".cs"}),
+    ),
+    "kotlin": ProjectTypeInfo(
+        description="Kotlin Project",
+        indicators=("*.kt", "build.gradle.kts", ".kt"),
+        file_patterns=("*.kt", "*.kts"),
+        required_files=(),
+        priority=5,
+        required_extensions=frozenset({".kt", ".kts"}),
+    ),
 }
 
-# Add cache for scan results with expiration
-_scan_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(glob: str) -> re.Pattern[str]:
+    """Compile a glob pattern into a regex matching a whole path.
+
+    Args:
+        glob: Pattern where ``*`` matches any run of characters, ``/`` included
+
+    Returns:
+        re.Pattern[str]: Compiled pattern, cached per glob
+    """
+    return re.compile(fnmatch.translate(glob))
+
+
+def _simple_extension(glob: str) -> str | None:
+    """Return the extension matched by a plain ``*.ext`` glob.
+
+    Args:
+        glob: Glob pattern to inspect
+
+    Returns:
+        Optional[str]: The extension including its dot (e.g. ``".py"``), or
+            None if the pattern is anything other than ``*`` plus an extension
+    """
+    ext = glob[1:]
+    if glob.startswith("*.") and not any(c in ext[1:] for c in "*./"):
+        return ext
+    return None
+
+
+# Most patterns are plain "*.ext" globs, matched by bucketing files on their
+# extension in one pass; any other glob is compiled once at import
+_GLOB_INDICATORS: dict[str, re.Pattern[str]] = {
+    indicator: _compile_glob(indicator)
+    for rules in PROJECT_TYPES.values()
+    for indicator in rules.indicators
+    if "*" in indicator and _simple_extension(indicator) is None
+}
+
+
+def _index_file_patterns() -> tuple[
+    dict[str, tuple[str, ...]], dict[str, re.Pattern[str]]
+]:
+    """Split each project type's file patterns into extensions or a regex.
+
+    Returns:
+        Tuple[Dict[str, Tuple[str, ...]], Dict[str, re.Pattern[str]]]:
+            Extensions per type whose patterns are all ``*.ext`` globs, and
+            one compiled alternation per type with any other pattern
+    """
+    extensions_by_type: dict[str, tuple[str, ...]] = {}
+    patterns_by_type: dict[str, re.Pattern[str]] = {}
+    for type_name, rules in PROJECT_TYPES.items():
+        patterns = rules.file_patterns
+        extensions = [_simple_extension(pattern) for pattern in patterns]
+        if None in extensions:
+            patterns_by_type[type_name] = re.compile(
+                "|".join(map(fnmatch.translate, patterns))
+            )
+        elif extensions:
+            extensions_by_type[type_name] = tuple(extensions)  # type: ignore[arg-type]
+    return extensions_by_type, patterns_by_type
+
+
+_FILE_PATTERN_EXTENSIONS, _FILE_PATTERNS = _index_file_patterns()
+
+# Every extension some pattern asks about; other files are not bucketed
+_PATTERN_EXTENSIONS: frozenset[str] = frozenset(
+    ext
+    for rules in PROJECT_TYPES.values()
+    for pattern in rules.indicators + rules.file_patterns
+    if (ext := _simple_extension(pattern)) is not None
+)
+
+# Project types from most to least specific; the sort is stable, so types of
+# equal priority keep their PROJECT_TYPES order (the earlier one wins)
+_TYPES_BY_PRIORITY: list[tuple[str, ProjectTypeInfo]] = sorted(
+    PROJECT_TYPES.items(), key=lambda item: -item[1].priority
+)
+
+# Scan results per (canonical root, root, depth, ignored dirs), least recently
+# used first, with the time they were computed and the directory and manifest
+# mtimes they were computed from
+_scan_cache: OrderedDict[
+    tuple[str, str, int, tuple[str, ...] | None],
+    tuple[float, tuple[tuple[str, int | None], ...], list[dict[str, str]]],
+] = OrderedDict()
+_SCAN_CACHE_SIZE: int = 256
+
+# Maximum age in seconds of a cached detection or scan, bounding how long
+# edits that change no recorded mtime can go unnoticed
 CACHE_EXPIRATION: int = 300  # 5 minutes
 
+# Threads detecting sibling directories concurrently during a scan
+_SCAN_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+
 IGNORED_DIRECTORIES: set[str] = {
     ".git",
     ".github",
@@ -345,6 +381,9 @@ IGNORED_DIRECTORIES: set[str] = {
     ".vscode",
 }
 
+# Built-in and configured directory names, merged once for O(1) lookups
+_IGNORED: frozenset[str] = frozenset(IGNORED_DIRECTORIES) | IGNORED_NAMES
+
 
 def detect_project_type(project_path: str) -> ProjectInfo:
     """Detect the type of project in the given directory with improved accuracy.
@@ -367,57 +406,81 @@ def detect_project_type(project_path: str) -> ProjectInfo:
     Note:
         - Returns generic project info if path doesn't exist or is inaccessible
         - Uses a priority system to handle projects with multiple indicators
-        - Performs additional checks specific to each project type
+        - Requires root-level source files for types that specify extensions
+        - Only walks subdirectories once a glob indicator or file pattern
+          needs them
     """
-    if not os.path.exists(project_path):
-        return _get_generic_result()
-
+    # One pass over the root: every entry name, and the extensions of the
+    # files directly in it; a missing path fails here without a separate stat
+    files: list[str] = []
+    root_extensions: set[str] = set()
     try:
-        files = os.listdir(project_path)
-        files_set = set(files)  # For faster lookups
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                name = entry.name
+                files.append(name)
+                dot = name.rfind(".")
+                if dot >= 0 and entry.is_file():
+                    root_extensions.add(name[dot:])
     except (PermissionError, OSError):
         return _get_generic_result()
+    files_set = set(files)  # For faster lookups
 
-    # Get all files recursively up to depth 2 for better detection
-    all_files = _get_files_recursive(project_path, max_depth=2)
+    # Files up to depth 2, only walked once a pattern needs them
+    tree = _ProjectTree(project_path)
 
     project_type = "generic"
     max_priority = -1
     matched_files: list[str] = []
 
-    # Check each project type
-    for type_name, rules in PROJECT_TYPES.items():
-        priority = rules.get("priority", 0)
+    # Check each project type, most specific first; once a type has matched,
+    # no later one can outrank it
+    for type_name, rules in _TYPES_BY_PRIORITY:
+        priority = rules.priority
+        if priority <= max_priority:
+            break
         matched = False
         type_matched_files: list[str] = []
 
         # Check direct indicators (files/folders that strongly indicate a project type)
-        for indicator in rules.get("indicators", []):
-            if _check_indicator(indicator, files_set, all_files):
+        for indicator in rules.indicators:
+            if (
+                indicator in files_set
+                if "*" not in indicator
+                else _check_indicator(
+                    indicator, files_set, tree.all_files, tree.files_by_ext
+                )
+            ):
                 matched = True
                 type_matched_files.append(indicator)
 
         # Check file patterns if no direct indicators found
-        if not matched and "file_patterns" in rules:
-            for pattern in rules["file_patterns"]:
-                matching_files = _find_matching_files(pattern, all_files)
-                if matching_files:
-                    matched = True
-                    type_matched_files.extend(matching_files)
+        if not matched:
+            if type_name in _FILE_PATTERN_EXTENSIONS:
+                files_by_ext = tree.files_by_ext
+                matching_files = [
+                    f
+                    for ext in _FILE_PATTERN_EXTENSIONS[type_name]
+                    for f in files_by_ext.get(ext, ())
+                ]
+            elif type_name in _FILE_PATTERNS:
+                matching_files = _find_matching_files(
+                    _FILE_PATTERNS[type_name], tree.all_files
+                )
+            else:
+                matching_files = []
+            if matching_files:
+                matched = True
+                type_matched_files.extend(matching_files)
 
         # Check required files if specified
-        if rules.get("required_files"):
-            if not all(f in files_set for f in rules["required_files"]):
+        if rules.required_files:
+            if not all(f in files_set for f in rules.required_files):
                 matched = False
 
-        # Run additional checks if specified
-        if matched and rules.get("additional_checks"):
-            try:
-                matched = all(
-                    check(project_path) for check in rules["additional_checks"]
-                )
-            except Exception:
-                matched = False
+        # Require a root-level source file of this type if specified
+        if matched and rules.required_extensions:
+            matched = not rules.required_extensions.isdisjoint(root_extensions)
 
         # Update project type if this match has higher priority
         if matched and priority > max_priority:
@@ -425,20 +488,18 @@ def detect_project_type(project_path: str) -> ProjectInfo:
             max_priority = priority
             matched_files = type_matched_files
 
-    # Detect language and framework
-    language, framework = detect_language_and_framework(project_path)
+    # Detect language and framework, reusing the root listing
+    language, framework = detect_language_and_framework(project_path, files)
 
     # If no specific type detected, check for common development patterns
     if project_type == "generic":
-        project_type = _detect_generic_project_type(files_set, all_files)
+        project_type = _detect_generic_project_type(files_set, tree.all_files)
 
     result: ProjectInfo = {
         "type": project_type,
         "language": language,
         "framework": framework,
-        "description": PROJECT_TYPES.get(
-            project_type, {"description": "Generic Project"}
-        )["description"],
+        "description": _type_description(project_type),
         "matched_files": matched_files,
         "path": project_path,
     }
@@ -446,6 +507,80 @@ def detect_project_type(project_path: str) -> ProjectInfo:
     return result
 
 
+@functools.lru_cache(maxsize=4096)
+def _detect_project_type_at(
+    project_path: str,
+    stamps: tuple[tuple[str, int | None], ...],
+    period: int,
+) -> ProjectInfo:
+    """Detect the project type, memoized per directory and manifest mtimes.
+
+    Args:
+        project_path: Path to the project directory to analyze
+        stamps: Modification times of the directory and its manifests; only
+            part of the key
+        period: Index of the current CACHE_EXPIRATION window; only part of the key
+
+    Returns:
+        ProjectInfo: Result of detect_project_type, shared between callers
+    """
+    return detect_project_type(project_path)
+
+
+def _stat_and_detect(
+    project_path: str, use_cache: bool = True
+) -> tuple[tuple[tuple[str, int | None], ...], ProjectInfo]:
+    """Detect the project type through the cache, also returning the mtimes used.
+
+    The directory's mtime changes whenever an entry is added, removed or
+    renamed in it, which covers the root-level indicators detection mostly
+    relies on; the mtimes of the dependency manifests present cover in-place
+    edits to the files framework detection reads. Edits deeper in the tree
+    change neither, so results are also recomputed once every
+    CACHE_EXPIRATION seconds. Used by scans, which may probe the same
+    directories again.
+
+    Args:
+        project_path: Path to the project directory to analyze
+        use_cache: Whether to reuse memoized detections (default: True);
+            if False the directory is always detected afresh
+
+    Returns:
+        Tuple[Tuple[Tuple[str, Optional[int]], ...], ProjectInfo]:
+            ``(path, mtime_ns)`` pairs for the directory (None if it cannot be
+            stat'ed) and each manifest in it, and the detection result
+    """
+    try:
+        mtime_ns = os.stat(project_path).st_mtime_ns
+    except OSError:
+        return ((project_path, None),), _get_generic_result()
+    stamps = [(project_path, mtime_ns)]
+    for name in _MANIFEST_FILES:
+        path = os.path.join(project_path, name)
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            # Creating it later changes the directory's mtime
+            pass
+    if not use_cache:
+        return tuple(stamps), detect_project_type(project_path)
+    period = int(time.monotonic() // CACHE_EXPIRATION)
+    return tuple(stamps), _detect_project_type_at(project_path, tuple(stamps), period)
+
+
+def _type_description(project_type: str) -> str:
+    """Return the human-readable description of a project type.
+
+    Args:
+        project_type: Name of the project type
+
+    Returns:
+        str: Description from PROJECT_TYPES, or 'Generic Project' if unknown
+    """
+    rules = PROJECT_TYPES.get(project_type)
+    return rules.description if rules is not None else "Generic Project"
+
+
 def _get_generic_result() -> ProjectInfo:
     """Return a generic project result when type cannot be determined.
 
@@ -462,80 +597,141 @@ def _get_generic_result() -> ProjectInfo:
     }
 
 
+# Files collected for pattern checks before the walk stops; detection only
+# needs to see an extension once, so huge trees add cost but no signal
+_MAX_TREE_FILES: int = 2048
+
+
+class _ProjectTree:
+    """Files below a project directory, walked on first access.
+
+    Most projects are decided by root-level indicators, so the depth-2 walk
+    is deferred until a glob indicator or file pattern actually needs it.
+
+    Args:
+        project_path: Path to the project directory
+    """
+
+    def __init__(self, project_path: str) -> None:
+        self._project_path = project_path
+
+    @functools.cached_property
+    def all_files(self) -> set[str]:
+        """Set[str]: Files up to depth 2, relative to the project directory."""
+        return _get_files_recursive(
+            self._project_path, max_depth=2, max_files=_MAX_TREE_FILES
+        )
+
+    @functools.cached_property
+    def files_by_ext(self) -> dict[str, list[str]]:
+        """Dict[str, List[str]]: Files bucketed by the extensions patterns ask about."""
+        files_by_ext: dict[str, list[str]] = {}
+        for f in self.all_files:
+            dot = f.rfind(".")
+            if dot >= 0 and (ext := f[dot:]) in _PATTERN_EXTENSIONS:
+                files_by_ext.setdefault(ext, []).append(f)
+        return files_by_ext
+
+
 def _get_files_recursive(
-    path: str, max_depth: int = 2, current_depth: int = 0
+    path: str,
+    max_depth: int = 2,
+    current_depth: int = 0,
+    max_files: int | None = None,
 ) -> set[str]:
     """Get all files recursively up to max_depth.
 
     Args:
         path: Directory path to scan
         max_depth: Maximum directory depth to traverse (default: 2)
-        current_depth: Current traversal depth (used internally)
+        current_depth: Depth of ``path`` itself (default: 0)
+        max_files: Stop descending once this many files were collected;
+            the directory being read is still finished (default: no limit)
 
     Returns:
         Set[str]: Set of file paths relative to the root path
 
     Note:
-        - Skips hidden directories
+        - Walks breadth-first with an explicit queue instead of recursing, so
+          a limited walk keeps the shallowest files
+        - Skips hidden directories, ignored directories and directory symlinks
         - Handles permission errors gracefully
         - Returns empty set if path is inaccessible
     """
+    files: set[str] = set()
     if current_depth > max_depth:
-        return set()
-
-    try:
-        files: set[str] = set()
-        with os.scandir(path) as entries:
-            for entry in entries:
-                if entry.is_file():
-                    files.add(entry.name)
-                elif entry.is_dir() and not entry.name.startswith("."):
-                    subfiles = _get_files_recursive(
-                        entry.path, max_depth, current_depth + 1
-                    )
-                    files.update(f"{entry.name}/{f}" for f in subfiles)
         return files
-    except (PermissionError, OSError):
-        return set()
+
+    pending: deque[tuple[str, str, int]] = deque([(path, "", current_depth)])
+    while pending:
+        if max_files is not None and len(files) >= max_files:
+            break
+        dir_path, prefix, depth = pending.popleft()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_file():
+                        files.add(prefix + name)
+                    elif (
+                        depth < max_depth
+                        and not name.startswith(".")
+                        and name not in _IGNORED
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        pending.append((entry.path, f"{prefix}{name}/", depth + 1))
+        except OSError:
+            # Skip directories we can't access
+            continue
+    return files
 
 
-def _check_indicator(indicator: str, files_set: set[str], all_files: set[str]) -> bool:
+def _check_indicator(
+    indicator: str,
+    files_set: set[str],
+    all_files: set[str],
+    files_by_ext: dict[str, list[str]] | None = None,
+) -> bool:
     """Check if an indicator matches any files in the project.
 
     Args:
         indicator: File pattern or name to check for
         files_set: Set of files in the root directory
         all_files: Set of all files in the project (including subdirectories)
+        files_by_ext: Optional files bucketed by extension, as built by
+            detect_project_type; answers ``*.ext`` indicators with a lookup
 
     Returns:
         bool: True if the indicator matches any files, False otherwise
 
     Note:
-        Handles both exact matches and glob patterns (using * wildcard)
+        Handles both exact matches and glob patterns (using * wildcard);
+        ``*.ext`` globs are a suffix check and any other glob is compiled once
     """
     if "*" in indicator:
-        pattern = indicator.replace(".", "[.]").replace("*", ".*")
-        return any(re.match(pattern + "$", f) for f in all_files)
+        ext = _simple_extension(indicator)
+        if ext is not None:
+            if files_by_ext is not None:
+                return ext in files_by_ext
+            return any(f.endswith(ext) for f in all_files)
+        pattern = _GLOB_INDICATORS.get(indicator) or _compile_glob(indicator)
+        match = pattern.match
+        return any(match(f) for f in all_files)
     return indicator in files_set
 
 
-def _find_matching_files(pattern: str, files: set[str]) -> list[str]:
-    """Find files matching a given pattern.
+def _find_matching_files(pattern: re.Pattern[str], files: set[str]) -> list[str]:
+    """Find files matching a compiled file pattern.
 
     Args:
-        pattern: File pattern to match against
+        pattern: Compiled pattern, e.g. a type's entry in ``_FILE_PATTERNS``
         files: Set of files to search through
 
     Returns:
         List[str]: List of file names that match the pattern
-
-    Note:
-        Supports both exact matches and glob patterns (using * wildcard)
     """
-    if "*" in pattern:
-        pattern = pattern.replace(".", "[.]").replace("*", ".*")
-        return [f for f in files if re.match(pattern + "$", f)]
-    return [f for f in files if f == pattern]
+    match = pattern.match
+    return [f for f in files if match(f)]
 
 
 def _detect_generic_project_type(files_set: set[str], all_files: set[str]) -> str:
@@ -576,11 +772,158 @@ def _detect_generic_project_type(files_set: set[str], all_files: set[str]) -> st
     return "generic_dev" if matched_categories else "generic"
 
 
-def detect_language_and_framework(project_path: str) -> tuple[str, str]:
+# Language detection based on file extensions and key files
+LANGUAGE_INDICATORS: dict[str, list[str]] = {
+    "python": [".py", "requirements.txt", "setup.py", "Pipfile"],
+    "javascript": [".js", "package.json"],
+    "typescript": [".ts", ".tsx", "tsconfig.json"],
+    "kotlin": [".kt", "build.gradle.kts"],
+    "php": [".php", "composer.json"],
+    "swift": [".swift", "Package.swift"],
+    "cpp": [".cpp", ".hpp", ".cc", ".cxx"],
+    "c": [".c", ".h"],
+    "csharp": [".cs", ".csproj", ".sln"],
+    "java": [".java", "pom.xml", "build.gradle"],
+    "go": [".go", "go.mod", "go.sum"],
+    "ruby": [".rb", "Gemfile", "Rakefile"],
+    "rust": [".rs", "Cargo.toml"],
+    "dart": [".dart", "pubspec.yaml"],
+    "scala": [".scala", "build.sbt"],
+}
+
+# LANGUAGE_INDICATORS split into file extensions, matched against the last
+# extension of a name, and key-file names, matched as substrings
+_LANGUAGE_RULES: dict[str, tuple[frozenset[str], tuple[str, ...]]] = {
+    lang: (
+        frozenset(ind for ind in indicators if ind.startswith(".")),
+        tuple(ind for ind in indicators if not ind.startswith(".")),
+    )
+    for lang, indicators in LANGUAGE_INDICATORS.items()
+}
+
+# Framework detection based on specific files/directories
+FRAMEWORK_INDICATORS: dict[str, list[str]] = {
+    "django": ["manage.py", "django.contrib"],
+    "flask": ["flask", "Flask=="],
+    "fastapi": ["fastapi"],
+    "react": ["react", "React."],
+    "express": ["express"],
+    "dotnet": ["Microsoft.NET.Sdk"],
+    "qt": ["Qt.", "QtCore"],
+    "gtk": ["gtk", "Gtk"],
+    "unity": ["UnityEngine"],
+    "unreal": ["UE4", "UE5"],
+    "pytorch": ["torch", "pytorch"],
+    "tensorflow": ["tensorflow"],
+    "rails": ["rails", "Rails"],
+    "spring": ["spring-boot", "SpringBoot"],
+    "laravel": ["laravel", "Laravel"],
+    "gin": ["gin-gonic/gin"],
+    "flutter": ["flutter", "Flutter"],
+    "angular": ["@angular/core"],
+    "vue": ["vue", "Vue"],
+    "svelte": ["svelte"],
+    "next": ["next", "Next.js"],
+    "nuxt": ["nuxt", "Nuxt.js"],
+    "nest": ["@nestjs/core"],
+    "fiber": ["fiber"],
+    "echo": ["labstack/echo"],
+    "rocket": ["rocket"],
+    "actix": ["actix-web"],
+    "axum": ["axum"],
+    "sinatra": ["sinatra"],
+    "hanami": ["hanami"],
+    "play": ["play.api"],
+    "akka": ["akka"],
+    "ktor": ["ktor"],
+    "micronaut": ["micronaut"],
+    "quarkus": ["quarkus"],
+    "helidon": ["helidon"],
+}
+
+
+def _framework_needles() -> tuple[tuple[bytes, str], ...]:
+    """Lowercase the framework indicators into a minimal list of substrings.
+
+    Indicators that only differ in case collapse into one, and an indicator
+    containing a shorter one of the same framework (``"flask=="`` after
+    ``"flask"``) is dropped, since it can only match where the shorter does.
+
+    Returns:
+        Tuple[Tuple[bytes, str], ...]: ``(needle, framework)`` pairs, last
+            framework first: a framework listed later wins when several match,
+            so the first needle found decides
+    """
+    needles: list[tuple[bytes, str]] = []
+    for framework, indicators in reversed(FRAMEWORK_INDICATORS.items()):
+        lowered = {indicator.lower() for indicator in indicators}
+        needles.extend(
+            (needle.encode(), framework)
+            for needle in sorted(lowered)
+            if not any(other != needle and other in needle for other in lowered)
+        )
+    return tuple(needles)
+
+
+_FRAMEWORK_NEEDLES: tuple[tuple[bytes, str], ...] = _framework_needles()
+
+# Files whose contents are searched for framework indicators
+_MANIFEST_FILES: frozenset[str] = frozenset(
+    {"requirements.txt", "package.json", "composer.json"}
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_manifest_lower(path: str, mtime_ns: int) -> bytes:
+    """Read a dependency manifest lowercased, memoized per modification time.
+
+    The file is read as bytes and lowercased as ASCII, since every framework
+    indicator is ASCII; nothing is decoded.
+
+    Args:
+        path: Path to the manifest file
+        mtime_ns: Modification time of the file; only part of the key
+
+    Returns:
+        bytes: Lowercased file contents, or empty bytes if unreadable
+    """
+    try:
+        with open(path, "rb") as file:
+            return file.read().lower()
+    except OSError:
+        return b""
+
+
+def _manifest_contents(project_path: str, files: list[str]) -> list[bytes]:
+    """Return the lowercased contents of the dependency manifests in a directory.
+
+    Args:
+        project_path: Path to the project directory
+        files: Names of the entries in the directory
+
+    Returns:
+        List[bytes]: Contents of each readable manifest among ``files``
+    """
+    contents = []
+    for f in files:
+        if f in _MANIFEST_FILES:
+            path = os.path.join(project_path, f)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            contents.append(_read_manifest_lower(path, mtime_ns))
+    return contents
+
+
+def detect_language_and_framework(
+    project_path: str, files: list[str] | None = None
+) -> tuple[str, str]:
     """Detect the primary programming language and framework used in a project.
 
     Args:
         project_path: Path to the project directory
+        files: Optional listing of the directory, to avoid listing it again
 
     Returns:
         Tuple[str, str]: A tuple containing:
@@ -591,104 +934,71 @@ def detect_language_and_framework(project_path: str) -> tuple[str, str]:
         - Language detection based on file extensions and key files
         - Framework detection based on dependency files and imports
         - Returns ('unknown', 'none') if detection fails or path is inaccessible
+        - Manifests are read once per call, and their contents are cached
+          until the file's mtime changes
     """
-    try:
-        files = os.listdir(project_path)
-    except:
-        return "unknown", "none"
-
-    # Language detection based on file extensions and key files
-    language_indicators = {
-        "python": [".py", "requirements.txt", "setup.py", "Pipfile"],
-        "javascript": [".js", "package.json"],
-        "typescript": [".ts", ".tsx", "tsconfig.json"],
-        "kotlin": [".kt", "build.gradle.kts"],
-        "php": [".php", "composer.json"],
-        "swift": [".swift", "Package.swift"],
-        "cpp": [".cpp", ".hpp", ".cc", ".cxx"],
-        "c": [".c", ".h"],
-        "csharp": [".cs", ".csproj", ".sln"],
-        "java": [".java", "pom.xml", "build.gradle"],
-        "go": [".go", "go.mod", "go.sum"],
-        "ruby": [".rb", "Gemfile", "Rakefile"],
-        "rust": [".rs", "Cargo.toml"],
-        "dart": [".dart", "pubspec.yaml"],
-        "scala": [".scala", "build.sbt"],
-    }
-
-    # Framework detection based on specific files/directories
-    framework_indicators = {
-        "django": ["manage.py", "django.contrib"],
-        "flask": ["flask", "Flask=="],
-        "fastapi": ["fastapi"],
-        "react": ["react", "React."],
-        "express": ["express"],
-        "dotnet": ["Microsoft.NET.Sdk"],
-        "qt": ["Qt.", "QtCore"],
-        "gtk": ["gtk", "Gtk"],
-        "unity": ["UnityEngine"],
-        "unreal": ["UE4", "UE5"],
-        "pytorch": ["torch", "pytorch"],
-        "tensorflow": ["tensorflow"],
-        "rails": ["rails", "Rails"],
-        "spring": ["spring-boot", "SpringBoot"],
-        "laravel": ["laravel", "Laravel"],
-        "gin": ["gin-gonic/gin"],
-        "flutter": ["flutter", "Flutter"],
-        "angular": ["@angular/core"],
-        "vue": ["vue", "Vue"],
-        "svelte": ["svelte"],
-        "next": ["next", "Next.js"],
-        "nuxt": ["nuxt", "Nuxt.js"],
-        "nest": ["@nestjs/core"],
-        "fiber": ["fiber"],
-        "echo": ["labstack/echo"],
-        "rocket": ["rocket"],
-        "actix": ["actix-web"],
-        "axum": ["axum"],
-        "sinatra": ["sinatra"],
-        "hanami": ["hanami"],
-        "play": ["play.api"],
-        "akka": ["akka"],
-        "ktor": ["ktor"],
-        "micronaut": ["micronaut"],
-        "quarkus": ["quarkus"],
-        "helidon": ["helidon"],
-    }
+    if files is None:
+        try:
+            files = os.listdir(project_path)
+        except:
+            return "unknown", "none"
 
     # Detect language
     detected_language = "unknown"
     max_matches = 0
 
-    for lang, indicators in language_indicators.items():
-        matches = 0
-        for f in files:
-            if any(
-                f.endswith(ind) if ind.startswith(".") else ind in f
-                for ind in indicators
-            ):
-                matches += 1
+    # Count files per extension once; key-file names are substring matches,
+    # so probe them against all names joined before looking at single files
+    ext_counts = Counter(f[f.rfind(".") :] for f in files if "." in f)
+    joined = "\0".join(files)
+
+    for lang, (extensions, names) in _LANGUAGE_RULES.items():
+        matches = sum(ext_counts[ext] for ext in extensions)
+        present = [name for name in names if name in joined]
+        if present:
+            matches += sum(
+                1
+                for f in files
+                if f[f.rfind(".") :] not in extensions
+                and any(name in f for name in present)
+            )
         if matches > max_matches:
             max_matches = matches
             detected_language = lang
 
     # Detect framework by checking file contents
     detected_framework = "none"
-    for framework, indicators in framework_indicators.items():
-        for f in files:
-            if f in ["requirements.txt", "package.json", "composer.json"]:
-                try:
-                    with open(os.path.join(project_path, f)) as file:
-                        content = file.read().lower()
-                        if any(ind.lower() in content for ind in indicators):
-                            detected_framework = framework
-                            break
-                except:
-                    continue
+    manifests = _manifest_contents(project_path, files)
+    if manifests:
+        for needle, framework in _FRAMEWORK_NEEDLES:
+            if any(needle in content for content in manifests):
+                detected_framework = framework
+                break
 
     return detected_language, detected_framework
 
 
+# File types by lowercased extension, without the leading dot
+_FILE_TYPES: dict[str, tuple[str, str]] = {
+    "py": ("Python Source", "Python script containing project logic"),
+    "js": ("JavaScript", "JavaScript file for client-side functionality"),
+    "ts": ("TypeScript", "TypeScript source file"),
+    "tsx": ("TypeScript/React", "React component with TypeScript"),
+    "kt": ("Kotlin Source", "Kotlin implementation file"),
+    "php": ("PHP Source", "PHP script for server-side functionality"),
+    "swift": ("Swift Source", "Swift implementation file"),
+    "cpp": ("C++ Source", "C++ implementation file"),
+    "hpp": ("C++ Header", "C++ header file"),
+    "c": ("C Source", "C implementation file"),
+    "h": ("C/C++ Header", "Header file"),
+    "cs": ("C# Source", "C# implementation file"),
+    "csx": ("C# Script", "C# script file"),
+}
+
+_GENERIC_FILE_TYPE: tuple[str, str] = ("Generic", "Project file")
+
+
+@functools.lru_cache(maxsize=4096)
 def get_file_type_info(filename: str) -> tuple[str, str]:
     """Get file type information based on file extension.
 
@@ -699,26 +1009,15 @@ def get_file_type_info(filename: str) -> tuple[str, str]:
         Tuple[str, str]: A tuple containing:
             - File type name (e.g., 'Python Source', 'JavaScript')
             - Description of the file type and its purpose
-    """
-    ext = os.path.splitext(filename)[1].lower()
-
-    type_map = {
-        ".py": ("Python Source", "Python script containing project logic"),
-        ".js": ("JavaScript", "JavaScript file for client-side functionality"),
-        ".ts": ("TypeScript", "TypeScript source file"),
-        ".tsx": ("TypeScript/React", "React component with TypeScript"),
-        ".kt": ("Kotlin Source", "Kotlin implementation file"),
-        ".php": ("PHP Source", "PHP script for server-side functionality"),
-        ".swift": ("Swift Source", "Swift implementation file"),
-        ".cpp": ("C++ Source", "C++ implementation file"),
-        ".hpp": ("C++ Header", "C++ header file"),
-        ".c": ("C Source", "C implementation file"),
-        ".h": ("C/C++ Header", "Header file"),
-        ".cs": ("C# Source", "C# implementation file"),
-        ".csx": ("C# Script", "C# script file"),
-    }
 
-    return type_map.get(ext, ("Generic", "Project file"))
+    Note:
+        Results are memoized per file name.
+    """
+    head, dot, ext = filename.rpartition(".")
+    # Like os.path.splitext, a dotfile such as ".py" has no extension
+    if not dot or not head.rpartition("/")[2].strip("."):
+        return _GENERIC_FILE_TYPE
+    return _FILE_TYPES.get(ext.lower(), _GENERIC_FILE_TYPE)
 
 
 def scan_for_projects(
@@ -732,7 +1031,8 @@ def scan_for_projects(
     Args:
         root_path: Root directory to start scanning from
         max_depth: Maximum directory depth to traverse (default: 3)
-        ignored_dirs: List of directory names to ignore (default: None)
+        ignored_dirs: Directory names to ignore in addition to IGNORED_DIRECTORIES
+            and the configured ignored_directories (default: None)
         use_cache: Whether to use cached results (default: True)
 
     Returns:
@@ -746,28 +1046,66 @@ def scan_for_projects(
 
     Note:
         - Uses caching to improve performance on subsequent scans
-        - Cache expires after CACHE_EXPIRATION seconds (default: 300)
-        - Ignores directories specified in IGNORED_DIRECTORIES
+        - Cached results are keyed on the canonical and the given root path
+          (so returned paths match ``root_path`` as with ``use_cache=False``)
+          and reused for up to CACHE_EXPIRATION seconds while every
+          directory the scan listed or detected and every manifest in a
+          detected directory keeps its mtime, which costs a few stats per
+          directory instead of a rescan; the 256 most recent scans are kept
+        - Ignores IGNORED_DIRECTORIES, the configured ignored_directories
+          and ``ignored_dirs``
     """
-    cache_key = f"{root_path}:{max_depth}"
+    if not use_cache:
+        return _do_scan(root_path, max_depth, ignored_dirs, use_cache=False)
+
+    abs_path = os.path.abspath(root_path or ".")
+    cache_key = (
+        os.path.realpath(abs_path),
+        abs_path,
+        max_depth,
+        tuple(ignored_dirs) if ignored_dirs is not None else None,
+    )
+
+    cached = _scan_cache.get(cache_key)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < CACHE_EXPIRATION
+        and _stamps_match(cached[1])
+    ):
+        _scan_cache.move_to_end(cache_key)
+        return cached[2]
+
+    created = time.monotonic()
+    stamps: dict[str, int | None] = {}
+    results = _do_scan(root_path, max_depth, ignored_dirs, stamps)
+    _scan_cache[cache_key] = (created, tuple(stamps.items()), results)
+    _scan_cache.move_to_end(cache_key)
+    if len(_scan_cache) > _SCAN_CACHE_SIZE:
+        _scan_cache.popitem(last=False)
+    return results
 
-    # Check cache
-    if use_cache and cache_key in _scan_cache:
-        cache_time, cached_results = _scan_cache[cache_key]
-        # Cache is valid for 5 minutes
-        if time.time() - cache_time < CACHE_EXPIRATION:
-            return cached_results
 
-    # Perform scan as usual
-    results = _do_scan(root_path, max_depth, ignored_dirs)
+def _stamps_match(stamps: tuple[tuple[str, int | None], ...]) -> bool:
+    """Check that directories and manifests still have the mtimes a scan recorded.
 
-    # Save to cache
-    if use_cache:
-        _scan_cache[cache_key] = (time.time(), results)
+    Args:
+        stamps: ``(path, mtime_ns)`` pairs; None records a failed stat
 
-    return results
+    Returns:
+        bool: True if no directory was added to, removed from or replaced and
+            no manifest was modified
+    """
+    for path, mtime_ns in stamps:
+        try:
+            current: int | None = os.stat(path).st_mtime_ns
+        except OSError:
+            current = None
+        if current != mtime_ns:
+            return False
+    return True
 
 
+@functools.lru_cache(maxsize=32)
 def get_project_description(project_path: str) -> dict[str, str | list[str]]:
     """Get project description and key features using standardized approach.
 
@@ -790,16 +1128,38 @@ def get_project_description(project_path: str) -> dict[str, str | list[str]]:
 
     Raises:
         Exception: If there's an error detecting project type or analyzing features
+
+    Note:
+        Results are memoized per path and shared between callers, so treat the
+        returned dict as read-only. Call ``get_project_description.cache_clear()``
+        when the project's manifests change.
+    """
+    return _describe_project(project_path)
+
+
+def _describe_project(
+    project_path: str, project_info: ProjectInfo | None = None
+) -> dict[str, str | list[str]]:
+    """Build the project description returned by get_project_description.
+
+    Args:
+        project_path: Path to the project root directory
+        project_info: Result of detect_project_type for the directory, if
+            already known; detected here otherwise
+
+    Returns:
+        dict[str, Union[str, list[str]]]: Name, description and key features
     """
     try:
-        project_info = detect_project_type(project_path)
+        if project_info is None:
+            project_info = detect_project_type(project_path)
         project_type = project_info["type"]
 
         result: dict[str, str | list[str]] = {
             "name": os.path.basename(project_path),
             "description": "Project directory structure and information",
             "key_features": [
-                f"Type: {PROJECT_TYPES.get(project_type, {'description': 'Generic Project'})['description']}",
+                f"Type: {_type_description(project_type)}",
                 f"Language: {project_info['language']}",
                 f"Framework: {project_info['framework']}",
                 "File and directory tracking",
@@ -819,14 +1179,22 @@ def get_project_description(project_path: str) -> dict[str, str | list[str]]:
 
 
 def _do_scan(
-    root_path: str, max_depth: int = 3, ignored_dirs: list[str] | None = None
+    root_path: str,
+    max_depth: int = 3,
+    ignored_dirs: list[str] | None = None,
+    stamps: dict[str, int | None] | None = None,
+    use_cache: bool = True,
 ) -> list[dict[str, str]]:
     """Perform a scan of the directory to find projects.
 
     Args:
         root_path: Root directory to start scanning from
         max_depth: Maximum directory depth to traverse (default: 3)
-        ignored_dirs: List of directory names to ignore (default: None)
+        ignored_dirs: Directory names to ignore in addition to IGNORED_DIRECTORIES
+            and the configured ignored_directories (default: None)
+        stamps: Optional dict that receives the mtime of every directory and
+            manifest the result depends on, taken before it was read
+        use_cache: Whether to reuse memoized detections (default: True)
 
     Returns:
         List[Dict[str, str]]: List of dictionaries containing project information:
@@ -839,84 +1207,106 @@ def _do_scan(
 
     Note:
         - Checks root directory first before scanning subdirectories
+        - Lists and detects each depth of the tree concurrently on a thread
+          pool, returning projects in depth-first listing order
         - Skips ignored directories and inaccessible paths
-        - Uses project type detection with caching
+        - Reuses project type detection while a directory's and its
+          manifests' mtimes are unchanged (unless ``use_cache`` is False),
+          and describes projects from that result instead of detecting again
     """
-    if ignored_dirs is None:
-        ignored_dirs = _config.get("ignored_directories", [])
+    ignored = _IGNORED if ignored_dirs is None else _IGNORED.union(ignored_dirs)
 
     projects: list[dict[str, str]] = []
     root_path = os.path.abspath(root_path or ".")
 
-    # Check the root directory first
-    project_type = detect_project_type(root_path)
-    if project_type != "generic":
-        # Analyze project information
-        project_info = get_project_description(root_path)
-        language, framework = detect_language_and_framework(root_path)
+    def _add_project(path: str, detected: ProjectInfo) -> None:
+        """Record a detected project, reusing its detection result.
+
+        Args:
+            path: Project directory path
+            detected: Result of project type detection for the directory
+        """
+        project_info = _describe_project(path, detected)
         projects.append(
             {
-                "path": root_path,
-                "type": project_type,
-                "name": project_info.get("name", os.path.basename(root_path)),
+                "path": path,
+                "type": detected["type"],
+                "name": project_info.get("name", os.path.basename(path)),
                 "description": project_info.get(
                     "description", "No description available"
                 ),
-                "language": language,
-                "framework": framework,
+                "language": detected["language"],
+                "framework": detected["framework"],
             }
         )
 
-    def _scan_directory(current_path: str, current_depth: int) -> None:
-        """Recursively scan directory for projects.
-
-        Args:
-            current_path: Current directory being scanned
-            current_depth: Current depth in the directory tree
+    # Check the root directory first
+    if stamps is None:
+        stamps = {}
+    root_stamps, detected = _stat_and_detect(root_path, use_cache)
+    stamps.update(root_stamps)
+    if detected["type"] != "generic":
+        _add_project(root_path, detected)
+
+    # Walk one depth at a time: every directory on a level is listed, and
+    # every subdirectory found detected, concurrently. Each directory carries
+    # the indices of its ancestors in their listings, so sorting the projects
+    # by that key restores depth-first listing order.
+    found: list[tuple[tuple[int, ...], str, ProjectInfo]] = []
+    level: list[tuple[str, tuple[int, ...]]] = [(root_path, ())]
+    depth = 0
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        while level and depth <= max_depth:
+            listings = executor.map(
+                _list_subdirectories, [path for path, _ in level], repeat(ignored)
+            )
+            children = [
+                (subdir, key + (index,))
+                for (_, key), subdirs in zip(level, listings, strict=True)
+                for index, subdir in enumerate(subdirs)
+            ]
+            detections = executor.map(
+                _stat_and_detect, [path for path, _ in children], repeat(use_cache)
+            )
+            level = []
+            for (path, key), (path_stamps, detected) in zip(
+                children, detections, strict=True
+            ):
+                stamps.update(path_stamps)
+                if detected["type"] != "generic":
+                    found.append((key, path, detected))
+                else:
+                    # If not a project, scan further
+                    level.append((path, key))
+            depth += 1
+
+    found.sort(key=lambda item: item[0])
+    for _, path, detected in found:
+        _add_project(path, detected)
+    return projects
 
-        Note:
-            - Updates the outer projects list when projects are found
-            - Skips ignored directories and inaccessible paths
-            - Stops at max_depth
-        """
-        if current_depth > max_depth:
-            return
 
-        try:
-            # Scan subdirectories
-            for item in os.listdir(current_path):
-                # Skip ignored directories immediately
-                if item in IGNORED_DIRECTORIES:
-                    continue
+def _list_subdirectories(path: str, ignored: frozenset[str]) -> list[str]:
+    """List the subdirectories of a directory for a project scan.
 
-                item_path = os.path.join(current_path, item)
-                if os.path.isdir(item_path):
-                    # Check each subdirectory
-                    project_type = detect_project_type(item_path)
-                    if project_type != "generic":
-                        # Analyze project information
-                        project_info = get_project_description(item_path)
-                        language, framework = detect_language_and_framework(item_path)
-                        projects.append(
-                            {
-                                "path": item_path,
-                                "type": project_type,
-                                "name": project_info.get("name", item),
-                                "description": project_info.get(
-                                    "description", "No description available"
-                                ),
-                                "language": language,
-                                "framework": framework,
-                            }
-                        )
-                    else:
-                        # If not a project, scan further
-                        _scan_directory(item_path, current_depth + 1)
-
-        except (PermissionError, OSError):
-            # Skip directories we can't access
-            pass
+    Args:
+        path: Directory to list
+        ignored: Directory names to skip
 
-    # Start scanning from the root directory
-    _scan_directory(root_path, 0)
-    return projects
+    Returns:
+        List[str]: Paths of the subdirectories in listing order, skipping
+            ignored names and directory symlinks; empty if inaccessible
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name in ignored:
+                    continue
+                # DirEntry knows its type from the listing, so no stat
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        # Skip directories we can't access
+        pass
+    return subdirs
@@ -1,13 +1,89 @@
 import os
+import threading
 import time
+from collections.abc import Callable, Iterable
 from typing import Any, Dict, NotRequired, Optional, TypedDict, Union
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import (
+    EVENT_TYPE_CLOSED_NO_WRITE,
+    EVENT_TYPE_OPENED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserver
 
 from contextforge_cli.vendored.cursorfocus.project_detector import detect_project_type
 from contextforge_cli.vendored.cursorfocus.rules_generator import RulesGenerator
 
+# Filesystem types whose changes made on other hosts never reach the local
+# kernel's notification API, so they have to be polled
+REMOTE_FILESYSTEMS: frozenset[str] = frozenset(
+    {
+        "nfs",
+        "nfs4",
+        "cifs",
+        "smbfs",
+        "smb3",
+        "9p",
+        "afs",
+        "ceph",
+        "glusterfs",
+        "davfs",
+        "fuse.sshfs",
+    }
+)
+
+
+def get_filesystem_type(path: str) -> str | None:
+    """Get the type of the filesystem a path lives on.
+
+    Args:
+        path: Path to look up
+
+    Returns:
+        Optional[str]: Filesystem type from ``/proc/mounts`` (e.g. "ext4",
+            "nfs4"), or None where that table is not available.
+    """
+    real_path = os.path.realpath(path)
+    best_mount = ""
+    fs_type = None
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Mount points escape spaces as \040
+                mount_point = fields[1].replace("\\040", " ")
+                if len(mount_point) <= len(best_mount):
+                    continue
+                if real_path == mount_point or real_path.startswith(
+                    mount_point.rstrip("/") + "/"
+                ):
+                    best_mount = mount_point
+                    fs_type = fields[2]
+    except OSError:
+        return None
+    return fs_type
+
+
+def create_observer(path: str) -> BaseObserver:
+    """Create the observer best suited to watch a path.
+
+    Args:
+        path: Directory that will be watched
+
+    Returns:
+        BaseObserver: A ``PollingObserver`` for network filesystems, whose remote
+            changes produce no local notifications, otherwise the platform's
+            native observer.
+    """
+    if get_filesystem_type(path) in REMOTE_FILESYSTEMS:
+        return PollingObserver()
+    return Observer()
+
 
 class RulesWatcher(FileSystemEventHandler):
     """File system event handler for monitoring project changes and updating rules.
@@ -137,6 +213,113 @@ class RulesWatcher(FileSystemEventHandler):
         )
 
 
+class ChangeTracker(FileSystemEventHandler):
+    """File system event handler recording which directories changed.
+
+    Lets a monitor loop sleep until something in the project changes instead
+    of waking up on a timer.
+
+    Attributes:
+        ignored_event_types: Event types that do not modify anything
+        root: Project root the event paths are relative to
+        ignore: Predicate on a path component; events under a matching
+            component (e.g. ``.git`` or ``node_modules``) are dropped
+        on_change: Callback run after a change is recorded, e.g. to wake an
+            event loop; called from the observer thread
+        ignored_paths: Normalized paths whose events are dropped, such as
+            files the monitor writes itself
+    """
+
+    ignored_event_types: frozenset[str] = frozenset(
+        {EVENT_TYPE_OPENED, EVENT_TYPE_CLOSED_NO_WRITE}
+    )
+
+    def __init__(
+        self,
+        root: str | None = None,
+        ignore: Callable[[str], bool] | None = None,
+        on_change: Callable[[], None] | None = None,
+        ignored_paths: Iterable[str] = (),
+    ) -> None:
+        """Initialize the ChangeTracker with no pending changes.
+
+        Args:
+            root: Project root; required for ``ignore`` to take effect
+            ignore: Optional predicate on path components
+            on_change: Optional callback run after each recorded change
+            ignored_paths: Optional exact paths to ignore, e.g. the Focus.md
+                file written in response to changes, which would otherwise
+                trigger another pass
+        """
+        self.root: str | None = root
+        self.ignore: Callable[[str], bool] | None = ignore
+        self.on_change: Callable[[], None] | None = on_change
+        self.ignored_paths: frozenset[str] = frozenset(
+            os.path.normpath(path) for path in ignored_paths
+        )
+        self._dirty: set[str] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Mark the directories touched by an event as dirty.
+
+        Args:
+            event: File system event from the observer thread
+        """
+        if event.event_type in self.ignored_event_types:
+            return
+
+        paths = [os.fsdecode(event.src_path)]
+        if getattr(event, "dest_path", None):
+            paths.append(os.fsdecode(event.dest_path))
+        paths = [path for path in paths if not self._is_ignored(path)]
+        if not paths:
+            return
+
+        with self._lock:
+            for path in paths:
+                self._dirty.add(path if event.is_directory else os.path.dirname(path))
+        if self.on_change is not None:
+            self.on_change()
+
+    def _is_ignored(self, path: str) -> bool:
+        """Check if a path is ignored or lies under an ignored component.
+
+        Args:
+            path: Absolute path from an event
+
+        Returns:
+            bool: True if the change should not mark the project dirty
+        """
+        if os.path.normpath(path) in self.ignored_paths:
+            return True
+        if self.ignore is None or self.root is None:
+            return False
+        rel_path = os.path.relpath(path, self.root)
+        return any(self.ignore(part) for part in rel_path.split(os.sep))
+
+    def mark_dirty(self, path: str) -> None:
+        """Mark a directory as changed, e.g. to force the next pass.
+
+        Args:
+            path: Directory to mark
+        """
+        with self._lock:
+            self._dirty.add(path)
+        if self.on_change is not None:
+            self.on_change()
+
+    def pop_dirty(self) -> set[str]:
+        """Return the directories changed since the last call and reset them.
+
+        Returns:
+            set[str]: Changed directories, empty if nothing changed
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+
+
 class ObserverDict(TypedDict, total=False):
     """TypedDict for mapping project IDs to Observer instances.
 
@@ -195,7 +378,7 @@ class ProjectWatcherManager:
             return project_id
 
         event_handler = RulesWatcher(project_path, project_id)
-        observer = Observer()
+        observer = create_observer(project_path)
         observer.schedule(event_handler, project_path, recursive=True)
         observer.start()
 
@@ -205,6 +388,28 @@ class ProjectWatcherManager:
         print(f"Started watching project {project_id}")
         return project_id
 
+    def watch_changes(
+        self, project_id: str, event_handler: FileSystemEventHandler
+    ) -> None:
+        """Attach an extra event handler to a watched project.
+
+        The handler shares the project's observer and its OS watch, so no
+        second recursive watch is set up.
+
+        Args:
+            project_id: ID of the watched project
+            event_handler: Handler to receive the project's file system events
+
+        Raises:
+            ValueError: If the project is not being watched
+        """
+        if project_id not in self.observers:
+            raise ValueError(f"Project {project_id} is not being watched")
+
+        self.observers[project_id].schedule(
+            event_handler, self.watchers[project_id].project_path, recursive=True
+        )
+
     def remove_project(self, project_id: str) -> None:
         """Stop watching a project.
 
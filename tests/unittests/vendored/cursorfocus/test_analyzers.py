@@ -0,0 +1,300 @@
+"""Tests for the CursorFocus file analyzers.
+
+This module covers function detection with the per-extension combined patterns,
+line counting and the persisted analysis cache.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from contextforge_cli.vendored.cursorfocus import analyzers
+from contextforge_cli.vendored.cursorfocus.analyzers import (
+    MMAP_THRESHOLD,
+    analyze_file_content_and_desc,
+    count_lines,
+    load_analysis_cache,
+)
+from contextforge_cli.vendored.cursorfocus.config import (
+    FUNCTION_PATTERNS_BY_EXTENSION,
+)
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+# One sample per extension with patterns, and the function names it defines
+SAMPLES: dict[str, tuple[str, list[str]]] = {
+    ".py": (
+        "class Foo:\n    def bar(self):\n        if self:\n            pass\n",
+        ["Foo", "bar"],
+    ),
+    ".js": (
+        "function alpha() {\n  if (x) {\n  }\n}\n"
+        "const beta = async function() {};\n"
+        "const gamma = (x) => x;\n"
+        "const obj = { delta: function() {} };\n",
+        ["alpha", "beta", "gamma", "delta"],
+    ),
+    ".ts": (
+        "export function typed(a: number): number {\n  return a;\n}\n"
+        "const arrow = async (b: string) => b;\n",
+        ["typed", "arrow"],
+    ),
+    ".tsx": (
+        "export const View = (props: Props) => {\n  return <div />;\n};\n",
+        ["View"],
+    ),
+    ".kt": ("fun greet(name: String): String {\n    return name\n}\n", ["greet"]),
+    ".php": (
+        "<?php\nclass A {\n    public function handle($x) {\n    }\n}\n",
+        ["handle"],
+    ),
+    ".swift": ("func greet(name: String) -> String {\n    return name\n}\n", ["greet"]),
+    ".cpp": (
+        "int Widget::size() const {\n  if (ready) {\n  }\n  return 0;\n}\n"
+        "virtual void draw() override;\n",
+        ["size", "draw"],
+    ),
+    ".c": ("static int add(int a, int b) {\n  return a + b;\n}\n", ["add"]),
+    ".h": ("int add(int a, int b);\n", ["add"]),
+    ".hpp": ("class Shape {\n  virtual double area() const = 0;\n};\n", ["area"]),
+    ".cs": (
+        "public class Svc {\n"
+        "    public async Task<int> RunAsync(int x) {\n    }\n"
+        "    private static void Helper() { }\n}\n",
+        ["RunAsync", "Helper"],
+    ),
+    ".csx": ("public string Greet(string name) => name;\n", ["Greet"]),
+}
+
+
+@pytest.fixture(autouse=True)
+def analysis_cache(monkeypatch: MonkeyPatch, tmp_path: Path) -> dict:
+    """Give each test an empty analysis cache persisted under tmp_path.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        tmp_path: Temporary directory for the test
+
+    Returns:
+        dict: The in-memory analysis cache used by the analyzer
+    """
+    cache: dict = {}
+    monkeypatch.setattr(analyzers, "_ANALYSIS_CACHE", cache)
+    monkeypatch.setattr(analyzers, "_analysis_cache_roots", set())
+    monkeypatch.setattr(analyzers, "_analysis_cache_dirty", False)
+    monkeypatch.setattr(analyzers, "_ANALYSIS_CACHE_DIR", str(tmp_path / "cache"))
+    return cache
+
+
+def _write(path: Path, content: str) -> str:
+    """Write a file and return its path as a string.
+
+    Args:
+        path: File to write
+        content: Text to write
+
+    Returns:
+        str: The path of the written file
+    """
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+class TestFunctionPatterns:
+    """Tests for the per-extension combined function patterns."""
+
+    def test_every_extension_has_a_sample(self) -> None:
+        """Test that the samples cover every extension with patterns."""
+        assert set(SAMPLES) == set(FUNCTION_PATTERNS_BY_EXTENSION)
+
+    @pytest.mark.parametrize("ext", sorted(SAMPLES))
+    def test_detects_functions(self, tmp_path: Path, ext: str) -> None:
+        """Test that each language's definitions are found, keywords excluded.
+
+        Args:
+            tmp_path: Temporary directory for the test
+            ext: Extension of the sample file
+        """
+        source, expected = SAMPLES[ext]
+        path = _write(tmp_path / f"sample{ext}", source)
+
+        functions, line_count = analyze_file_content_and_desc(path)
+
+        assert [name for name, _ in functions] == expected
+        assert line_count == source.count("\n")
+
+    def test_failed_declaration_finds_nothing(self, tmp_path: Path) -> None:
+        """Test that a long qualifier chain without a declaration matches nothing.
+
+        Args:
+            tmp_path: Temporary directory for the test
+        """
+        source = "static inline const " * 2000 + "\n"
+        path = _write(tmp_path / "qualifiers.cpp", source)
+
+        assert analyze_file_content_and_desc(path) == ([], 1)
+
+    def test_large_file_matches_small_file(self, tmp_path: Path) -> None:
+        """Test that memory-mapped files are analyzed like small ones.
+
+        Args:
+            tmp_path: Temporary directory for the test
+        """
+        source = "def café():\n    pass\n"
+        small = _write(tmp_path / "small.py", source)
+        large = _write(tmp_path / "large.py", source + "#" * MMAP_THRESHOLD + "\n")
+
+        assert analyze_file_content_and_desc(small) == (
+            [("café", "Function detected")],
+            2,
+        )
+        assert analyze_file_content_and_desc(large) == (
+            [("café", "Function detected")],
+            3,
+        )
+
+
+class TestCountLines:
+    """Tests for count_lines."""
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"", 0),
+            (b"a", 1),
+            (b"a\n", 1),
+            (b"a\nb", 2),
+            (b"a\r\nb\r\n", 2),
+            (b"\n\n", 2),
+        ],
+    )
+    def test_count_lines(self, data: bytes, expected: int) -> None:
+        """Test counting lines with and without a trailing newline.
+
+        Args:
+            data: File contents
+            expected: Expected number of lines
+        """
+        assert count_lines(data) == expected
+
+
+class TestAnalysisCache:
+    """Tests for the analysis cache."""
+
+    def test_hit_while_stat_key_unchanged(self, tmp_path: Path) -> None:
+        """Test that a file with the same mtime and size is served from cache.
+
+        Args:
+            tmp_path: Temporary directory for the test
+        """
+        path = _write(tmp_path / "mod.py", "def aaa():\n    pass\n")
+        st = os.stat(path)
+        assert analyze_file_content_and_desc(path)[0] == [("aaa", "Function detected")]
+
+        _write(tmp_path / "mod.py", "def bbb():\n    pass\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert analyze_file_content_and_desc(path)[0] == [("aaa", "Function detected")]
+
+    def test_invalidated_by_mtime_change(self, tmp_path: Path) -> None:
+        """Test that a newer mtime invalidates the cached analysis.
+
+        Args:
+            tmp_path: Temporary directory for the test
+        """
+        path = _write(tmp_path / "mod.py", "def aaa():\n    pass\n")
+        st = os.stat(path)
+        analyze_file_content_and_desc(path)
+
+        _write(tmp_path / "mod.py", "def bbb():\n    pass\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert analyze_file_content_and_desc(path)[0] == [("bbb", "Function detected")]
+
+    def test_invalidated_by_size_change(self, tmp_path: Path) -> None:
+        """Test that a different size invalidates the cached analysis.
+
+        Args:
+            tmp_path: Temporary directory for the test
+        """
+        path = _write(tmp_path / "mod.py", "def aaa():\n    pass\n")
+        st = os.stat(path)
+        analyze_file_content_and_desc(path)
+
+        _write(tmp_path / "mod.py", "def bbbb():\n    pass\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert analyze_file_content_and_desc(path)[0] == [("bbbb", "Function detected")]
+
+    def test_failures_are_not_cached(
+        self, tmp_path: Path, analysis_cache: dict
+    ) -> None:
+        """Test that a file that cannot be decoded is not cached.
+
+        Args:
+            tmp_path: Temporary directory for the test
+            analysis_cache: The in-memory analysis cache
+        """
+        path = tmp_path / "bad.py"
+        path.write_bytes(b"def x():\n    pass\n#\xff\n")
+
+        assert analyze_file_content_and_desc(str(path)) == ([], 0)
+        assert str(path) not in analysis_cache
+
+    def test_persisted_per_project_root(
+        self, tmp_path: Path, analysis_cache: dict
+    ) -> None:
+        """Test that entries under a loaded root survive a save and reload.
+
+        Args:
+            tmp_path: Temporary directory for the test
+            analysis_cache: The in-memory analysis cache
+        """
+        project = tmp_path / "project"
+        project.mkdir()
+        path = _write(project / "mod.py", "def aaa():\n    pass\n")
+        outside = _write(tmp_path / "outside.py", "def zzz():\n    pass\n")
+
+        load_analysis_cache(str(project))
+        analyze_file_content_and_desc(path)
+        analyze_file_content_and_desc(outside)
+        analyzers._save_analysis_cache()
+
+        analysis_cache.clear()
+        analyzers._analysis_cache_roots.clear()
+        load_analysis_cache(str(project))
+
+        assert set(analysis_cache) == {path}
+
+    def test_save_merges_other_processes_entries(
+        self, tmp_path: Path, analysis_cache: dict
+    ) -> None:
+        """Test that saving keeps entries another process saved meanwhile.
+
+        Args:
+            tmp_path: Temporary directory for the test
+            analysis_cache: The in-memory analysis cache
+        """
+        project = tmp_path / "project"
+        project.mkdir()
+        mine = _write(project / "mine.py", "def mine():\n    pass\n")
+        theirs = str(project / "theirs.py")
+
+        load_analysis_cache(str(project))
+        cache_file = analyzers._analysis_cache_file(str(project))
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({theirs: [1, 2, [["theirs", "Function detected"]], 2]}, f)
+
+        analyze_file_content_and_desc(mine)
+        analyzers._save_analysis_cache()
+
+        with open(cache_file, encoding="utf-8") as f:
+            assert set(json.load(f)) == {mine, theirs}
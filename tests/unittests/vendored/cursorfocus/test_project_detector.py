@@ -0,0 +1,115 @@
+"""Tests for the CursorFocus project detector.
+
+This module covers how cached project scans and descriptions react to changes.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from contextforge_cli.vendored.cursorfocus.project_detector import (
+    get_project_description,
+    scan_for_projects,
+)
+
+
+def _write_manifest(project: Path, framework: str) -> None:
+    """Write a package.json depending on a framework, with a newer mtime.
+
+    The mtime is pushed forward explicitly so an in-place edit is visible even
+    on file systems with coarse timestamps.
+
+    Args:
+        project: Project directory
+        framework: Name of the dependency to declare
+    """
+    manifest = project / "package.json"
+    mtime_ns = manifest.stat().st_mtime_ns if manifest.exists() else 0
+    manifest.write_text(f'{{"dependencies": {{"{framework}": "1"}}}}')
+    os.utime(manifest, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """Fixture providing a directory holding one JavaScript project.
+
+    Args:
+        tmp_path: Temporary directory for the test
+
+    Returns:
+        Path: The workspace root; the project lives in ``web``
+    """
+    project = tmp_path / "web"
+    project.mkdir()
+    (project / "index.js").write_text("export default {};\n")
+    _write_manifest(project, "vue")
+    return tmp_path
+
+
+class TestScanForProjects:
+    """Tests for scan_for_projects."""
+
+    def test_cached_scan_sees_manifest_edit(self, workspace: Path) -> None:
+        """Test that editing a manifest in place invalidates a cached scan.
+
+        Args:
+            workspace: The workspace fixture
+        """
+        assert scan_for_projects(str(workspace), 2)[0]["framework"] == "vue"
+
+        _write_manifest(workspace / "web", "svelte")
+
+        assert scan_for_projects(str(workspace), 2)[0]["framework"] == "svelte"
+
+    def test_uncached_scan_sees_manifest_edit(self, workspace: Path) -> None:
+        """Test that use_cache=False does not reuse memoized detections.
+
+        Args:
+            workspace: The workspace fixture
+        """
+        assert scan_for_projects(str(workspace), 2)[0]["framework"] == "vue"
+
+        _write_manifest(workspace / "web", "svelte")
+
+        projects = scan_for_projects(str(workspace), 2, use_cache=False)
+        assert projects[0]["framework"] == "svelte"
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_paths_follow_given_root(
+        self, workspace: Path, tmp_path_factory: pytest.TempPathFactory, use_cache: bool
+    ) -> None:
+        """Test that results are under the root as given, not its real path.
+
+        Args:
+            workspace: The workspace fixture
+            tmp_path_factory: Pytest factory for temporary directories
+            use_cache: Whether the scan may use cached results
+        """
+        link = tmp_path_factory.mktemp("links") / "workspace"
+        link.symlink_to(workspace, target_is_directory=True)
+
+        projects = scan_for_projects(str(link), 2, use_cache=use_cache)
+
+        assert [project["path"] for project in projects] == [str(link / "web")]
+
+
+class TestGetProjectDescription:
+    """Tests for get_project_description."""
+
+    def test_cache_clear_sees_manifest_edit(self, workspace: Path) -> None:
+        """Test that clearing the description cache picks up a manifest edit.
+
+        Args:
+            workspace: The workspace fixture
+        """
+        project = str(workspace / "web")
+        scan_for_projects(str(workspace), 2)
+        assert "vue" in get_project_description(project)["key_features"][2]
+
+        _write_manifest(workspace / "web", "svelte")
+        get_project_description.cache_clear()
+
+        assert "svelte" in get_project_description(project)["key_features"][2]
@@ -0,0 +1,172 @@
+"""Tests for the CursorFocus rules watcher.
+
+This module covers which file system events ChangeTracker records.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from watchdog.events import (
+    DirCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileOpenedEvent,
+)
+
+from contextforge_cli.vendored.cursorfocus.analyzers import should_ignore_file
+from contextforge_cli.vendored.cursorfocus.rules_watcher import ChangeTracker
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> str:
+    """Fixture providing a project root.
+
+    Args:
+        tmp_path: Temporary directory for the test
+
+    Returns:
+        str: Path of the project root
+    """
+    return str(tmp_path)
+
+
+@pytest.fixture
+def calls() -> list[None]:
+    """Fixture recording on_change callbacks.
+
+    Returns:
+        list[None]: One item per callback
+    """
+    return []
+
+
+@pytest.fixture
+def tracker(root: str, calls: list[None]) -> ChangeTracker:
+    """Fixture providing a tracker set up like the Focus.md monitor.
+
+    Args:
+        root: The project root
+        calls: List receiving one item per on_change callback
+
+    Returns:
+        ChangeTracker: Tracker ignoring Focus.md and ignored directories
+    """
+    focus_file = os.path.join(root, "Focus.md")
+    return ChangeTracker(
+        root,
+        ignore=should_ignore_file,
+        on_change=lambda: calls.append(None),
+        ignored_paths=(focus_file, f"{focus_file}.tmp"),
+    )
+
+
+class TestChangeTracker:
+    """Tests for ChangeTracker."""
+
+    def test_records_parent_of_changed_file(
+        self, tracker: ChangeTracker, root: str, calls: list[None]
+    ) -> None:
+        """Test that a file change marks its directory dirty.
+
+        Args:
+            tracker: The change tracker
+            root: The project root
+            calls: Recorded on_change callbacks
+        """
+        tracker.on_any_event(FileModifiedEvent(os.path.join(root, "src", "app.py")))
+
+        assert tracker.pop_dirty() == {os.path.join(root, "src")}
+        assert tracker.pop_dirty() == set()
+        assert len(calls) == 1
+
+    def test_records_created_directory(self, tracker: ChangeTracker, root: str) -> None:
+        """Test that a directory event marks the directory itself dirty.
+
+        Args:
+            tracker: The change tracker
+            root: The project root
+        """
+        tracker.on_any_event(DirCreatedEvent(os.path.join(root, "pkg")))
+
+        assert tracker.pop_dirty() == {os.path.join(root, "pkg")}
+
+    @pytest.mark.parametrize("name", ["Focus.md", "Focus.md.tmp"])
+    def test_ignores_focus_file(
+        self, tracker: ChangeTracker, root: str, calls: list[None], name: str
+    ) -> None:
+        """Test that writes to Focus.md do not trigger another pass.
+
+        Args:
+            tracker: The change tracker
+            root: The project root
+            calls: Recorded on_change callbacks
+            name: Name of the file written by the monitor
+        """
+        tracker.on_any_event(FileModifiedEvent(os.path.join(root, name)))
+
+        assert tracker.pop_dirty() == set()
+        assert calls == []
+
+    @pytest.mark.parametrize(
+        "parts",
+        [
+            (".git", "index"),
+            ("node_modules", "lib", "index.js"),
+            ("src", "__pycache__", "app.cpython-312.pyc"),
+        ],
+    )
+    def test_ignores_ignored_directories(
+        self,
+        tracker: ChangeTracker,
+        root: str,
+        calls: list[None],
+        parts: tuple[str, ...],
+    ) -> None:
+        """Test that churn under ignored directories is dropped.
+
+        Args:
+            tracker: The change tracker
+            root: The project root
+            calls: Recorded on_change callbacks
+            parts: Path components below the root
+        """
+        tracker.on_any_event(FileModifiedEvent(os.path.join(root, *parts)))
+
+        assert tracker.pop_dirty() == set()
+        assert calls == []
+
+    def test_ignores_opened_event(
+        self, tracker: ChangeTracker, root: str, calls: list[None]
+    ) -> None:
+        """Test that events which modify nothing are dropped.
+
+        Args:
+            tracker: The change tracker
+            root: The project root
+            calls: Recorded on_change callbacks
+        """
+        tracker.on_any_event(FileOpenedEvent(os.path.join(root, "app.py")))
+
+        assert tracker.pop_dirty() == set()
+        assert calls == []
+
+    def test_move_out_of_ignored_directory(
+        self, tracker: ChangeTracker, root: str
+    ) -> None:
+        """Test that only the non-ignored side of a move is recorded.
+
+        Args:
+            tracker: The change tracker
+            root: The project root
+        """
+        tracker.on_any_event(
+            FileMovedEvent(
+                os.path.join(root, "node_modules", "app.py"),
+                os.path.join(root, "src", "app.py"),
+            )
+        )
+
+        assert tracker.pop_dirty() == {os.path.join(root, "src")}